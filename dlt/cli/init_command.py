@@ -244,8 +244,7 @@ def init_command(
     pipeline_script, template_files = _get_template_files(init_module, use_generic_template)
     # prepare destination storage
     dest_storage = FileStorage(os.path.abspath("."))
-    if not dest_storage.has_folder(get_dlt_settings_dir()):
-        dest_storage.create_folder(get_dlt_settings_dir())
+    dest_storage.create_folder(get_dlt_settings_dir(), exists_ok=True)
     # get local index of verified source files
     local_index = files_ops.load_verified_sources_local_index(source_name)
     # folder deleted at dest - full refresh
@@ -1,3 +1,6 @@
+import os
+import sys
+import itertools
 import yaml
 from typing import Any, Optional, Sequence, Tuple
 import dlt
@@ -9,7 +12,7 @@ from dlt.common.destination.reference import TDestinationReferenceArg
 from dlt.common.runners import Venv
 from dlt.common.runners.stdout import iter_stdout
 from dlt.common.schema.utils import group_tables_by_resource, remove_defaults
-from dlt.common.storages import FileStorage, PackageStorage
+from dlt.common.storages import PackageStorage
 from dlt.pipeline.helpers import DropCommand
 from dlt.pipeline.exceptions import CannotRestorePipelineException
 
@@ -30,15 +33,21 @@ def pipeline_command(
     **command_kwargs: Any,
 ) -> None:
     if operation == "list":
+        # listing is a plain directory scan, it must never attach to a pipeline
         pipelines_dir = pipelines_dir or get_dlt_pipelines_dir()
-        storage = FileStorage(pipelines_dir)
-        dirs = storage.list_folder_dirs(".", to_root=False)
+        # scandir reuses the entry type returned with the listing so no stat per pipeline
+        try:
+            with os.scandir(pipelines_dir) as it:
+                dirs = [e.name for e in it if e.is_dir()]
+        except FileNotFoundError:
+            dirs = []
         if len(dirs) > 0:
             fmt.echo("%s pipelines found in %s" % (len(dirs), fmt.bold(pipelines_dir)))
         else:
             fmt.echo("No pipelines found in %s" % fmt.bold(pipelines_dir))
-        for _dir in dirs:
-            fmt.secho(_dir, fg="green")
+        if dirs:
+            # emit the whole listing in a single write
+            fmt.echo("\n".join(fmt.style(_dir, fg="green") for _dir in dirs))
         return
 
     try:
@@ -103,7 +112,7 @@ def pipeline_command(
             fmt.echo()
         return extracted_packages, norm_packages
 
-    fmt.echo("Found pipeline %s in %s" % (fmt.bold(p.pipeline_name), fmt.bold(p.pipelines_dir)))
+    fmt.echo(f"Found pipeline {fmt.bold(p.pipeline_name)} in {fmt.bold(p.pipelines_dir)}")
 
     if operation == "show":
         from dlt.common.runtime import signals
@@ -132,18 +141,19 @@ def pipeline_command(
             for line in iter_stdout(venv, *streamlit_cmd):
                 fmt.echo(line)
 
-    if operation == "info":
+    elif operation == "info":
         state: TSourceState = p.state  # type: ignore
         fmt.echo("Synchronized state:")
         for k, v in state.items():
             if not isinstance(v, dict):
-                fmt.echo("%s: %s" % (fmt.style(k, fg="green"), v))
+                fmt.echo(f"{fmt.style(k, fg='green')}: {v}")
         sources_state = state.get("sources")
         if sources_state:
             fmt.echo()
             fmt.secho("sources:", fg="green")
             if verbosity > 0:
-                fmt.echo(json.dumps(sources_state, pretty=True))
+                # pretty print only for humans, pipes and files get compact json
+                fmt.echo(json.dumps(sources_state, pretty=sys.stdout.isatty()))
             else:
                 fmt.echo("Add -v option to see sources state. Note that it could be large.")
 
@@ -151,14 +161,14 @@ def pipeline_command(
         fmt.echo("Local state:")
         for k, v in state["_local"].items():
             if not isinstance(v, dict):
-                fmt.echo("%s: %s" % (fmt.style(k, fg="green"), v))
+                fmt.echo(f"{fmt.style(k, fg='green')}: {v}")
         fmt.echo()
         if p.default_schema_name is None:
             fmt.warning("This pipeline does not have a default schema")
         else:
             is_single_schema = len(p.schema_names) == 1
             for schema_name in p.schema_names:
-                fmt.echo("Resources in schema: %s" % fmt.bold(schema_name))
+                fmt.echo(f"Resources in schema: {fmt.bold(schema_name)}")
                 schema = p.schemas[schema_name]
                 data_tables = {t["name"]: t for t in schema.data_tables()}
                 for resource_name, tables in group_tables_by_resource(data_tables).items():
@@ -173,12 +183,8 @@ def pipeline_command(
                             resource_state_ = resource_state(resource_name, source_state)
                             res_state_slots = len(resource_state_)
                     fmt.echo(
-                        "%s with %s table(s) and %s resource state slot(s)"
-                        % (
-                            fmt.bold(resource_name),
-                            fmt.bold(str(len(tables))),
-                            fmt.bold(str(res_state_slots)),
-                        )
+                        f"{fmt.bold(resource_name)} with {fmt.bold(str(len(tables)))} table(s) and"
+                        f" {fmt.bold(str(res_state_slots))} resource state slot(s)"
                     )
         fmt.echo()
         fmt.echo("Working dir content:")
@@ -186,8 +192,8 @@ def pipeline_command(
         loaded_packages = p.list_completed_load_packages()
         if loaded_packages:
             fmt.echo(
-                "Has %s completed load packages with following load ids:"
-                % fmt.bold(str(len(loaded_packages)))
+                f"Has {fmt.bold(str(len(loaded_packages)))} completed load packages with following"
+                " load ids:"
             )
             for load_id in loaded_packages:
                 fmt.echo(load_id)
@@ -197,42 +203,46 @@ def pipeline_command(
             fmt.echo("Pipeline does not have last run trace.")
         else:
             fmt.echo(
-                "Pipeline has last run trace. Use 'dlt pipeline %s trace' to inspect "
-                % pipeline_name
+                f"Pipeline has last run trace. Use 'dlt pipeline {pipeline_name} trace' to inspect "
             )
 
-    if operation == "trace":
+    elif operation == "trace":
         trace = p.last_trace
         if trace is None or len(trace.steps) == 0:
             fmt.warning("Pipeline does not have last run trace.")
             return
         fmt.echo(trace.asstr(verbosity))
 
-    if operation == "failed-jobs":
+    elif operation == "failed-jobs":
         completed_loads = p.list_completed_load_packages()
         normalized_loads = p.list_normalized_load_packages()
-        for load_id in completed_loads + normalized_loads:  # type: ignore
+        load_ids = list(itertools.chain(completed_loads, normalized_loads))
+        for load_id in load_ids:
             fmt.echo("Checking failed jobs in load id '%s'" % fmt.bold(load_id))
             failed_jobs = p.list_failed_jobs_in_package(load_id)
-            if failed_jobs:
-                for failed_job in p.list_failed_jobs_in_package(load_id):
-                    fmt.echo(
-                        "JOB: %s(%s)"
-                        % (
-                            fmt.bold(failed_job.job_file_info.job_id()),
-                            fmt.bold(failed_job.job_file_info.table_name),
-                        )
-                    )
-                    fmt.echo("JOB file type: %s" % fmt.bold(failed_job.job_file_info.file_format))
-                    fmt.echo("JOB file path: %s" % fmt.bold(failed_job.file_path))
-                    if verbosity > 0:
-                        fmt.echo(failed_job.asstr(verbosity))
-                    fmt.secho(failed_job.failed_message, fg="red")
-                    fmt.echo()
-            else:
+            if not failed_jobs:
                 fmt.echo("No failed jobs found")
+                continue
+            # buffer all failed jobs in the package and write them at once
+            lines = []
+            for failed_job in failed_jobs:
+                lines.append(
+                    "JOB: %s(%s)"
+                    % (
+                        fmt.bold(failed_job.job_file_info.job_id()),
+                        fmt.bold(failed_job.job_file_info.table_name),
+                    )
+                )
+                lines.append("JOB file type: %s" % fmt.bold(failed_job.job_file_info.file_format))
+                lines.append("JOB file path: %s" % fmt.bold(failed_job.file_path))
+                if verbosity > 0:
+                    lines.append(failed_job.asstr(verbosity))
+                if failed_job.failed_message:
+                    lines.append(fmt.style(failed_job.failed_message, fg="red"))
+                lines.append("")
+            fmt.echo("\n".join(lines))
 
-    if operation == "drop-pending-packages":
+    elif operation == "drop-pending-packages":
         extracted_packages, norm_packages = _display_pending_packages()
         if len(extracted_packages) == 0 and len(norm_packages) == 0:
             fmt.echo("No pending packages found")
@@ -240,7 +250,7 @@ def pipeline_command(
             p.drop_pending_packages(with_partial_loads=True)
             fmt.echo("Pending packages deleted")
 
-    if operation == "sync":
+    elif operation == "sync":
         if fmt.confirm(
             "About to drop the local state of the pipeline and reset all the schemas. The"
             " destination state, data and schemas are left intact. Proceed?",
@@ -251,7 +261,7 @@ def pipeline_command(
             fmt.echo("Restoring from destination")
             p.sync_destination()
 
-    if operation == "load-package":
+    elif operation == "load-package":
         load_id = command_kwargs.get("load_id")
         if not load_id:
             packages = sorted(p.list_extracted_load_packages())
@@ -285,7 +295,7 @@ def pipeline_command(
                     )
                 )
 
-    if operation == "schema":
+    elif operation == "schema":
         if not p.default_schema_name:
             fmt.warning("Pipeline does not have a default schema")
         else:
@@ -299,7 +309,7 @@ def pipeline_command(
             schema_str = s.to_pretty_yaml(remove_defaults=remove_defaults_)
         fmt.echo(schema_str)
 
-    if operation == "drop":
+    elif operation == "drop":
         drop = DropCommand(p, **command_kwargs)
         if drop.is_empty:
             fmt.echo(
@@ -349,3 +359,6 @@ def pipeline_command(
             fmt.warning(warning)
         if fmt.confirm("Do you want to apply these changes?", default=False):
             drop()
+
+    else:
+        raise CliCommandException("pipeline", f"Unknown pipeline operation {operation}")
@@ -7,6 +7,14 @@ DOT_DLT = ".dlt"
 # dlt data dir is by default not set, see get_dlt_data_dir for details
 DLT_DATA_DIR: str = None
 
+# data dir candidates that do not depend on the user home dir
+_VAR_DLT = os.path.join("/var", "dlt")
+_TMP_DLT = os.path.join(tempfile.gettempdir(), "dlt")
+# effective user does not change during process lifetime, geteuid not available on Windows
+_IS_ROOT = getattr(os, "geteuid", lambda: -1)() == 0
+# home dir does not change during process lifetime
+_USER_HOME: str = os.path.expanduser("~") or None
+
 
 def get_dlt_project_dir() -> str:
     """The dlt project dir is the current working directory but may be overridden by DLT_PROJECT_DIR env variable."""
@@ -22,8 +30,8 @@ def get_dlt_settings_dir() -> str:
 
 
 def make_dlt_settings_path(path: str) -> str:
-    """Returns path to file in dlt settings folder."""
-    return os.path.join(get_dlt_settings_dir(), path)
+    """Returns path to file in dlt settings folder. `path` must be relative."""
+    return f"{get_dlt_settings_dir()}{os.sep}{path}"
 
 
 def get_dlt_data_dir() -> str:
@@ -33,22 +41,16 @@ def get_dlt_data_dir() -> str:
     3. if current user does not have a home directory: in /tmp/dlt/
     4. if DLT_DATA_DIR is set in env then it is used
     """
-    if "DLT_DATA_DIR" in os.environ:
-        return os.environ["DLT_DATA_DIR"]
-
-    # geteuid not available on Windows
-    if hasattr(os, "geteuid") and os.geteuid() == 0:
+    data_dir = os.environ.get("DLT_DATA_DIR")
+    if data_dir is not None:
+        return data_dir
+    if _IS_ROOT:
         # we are root so use standard /var
-        return os.path.join("/var", "dlt")
-
-    home = _get_user_home_dir()
-    if home is None:
+        return _VAR_DLT
+    if _USER_HOME is None:
         # no home dir - use temp
-        return os.path.join(tempfile.gettempdir(), "dlt")
+        return _TMP_DLT
     else:
         # if home directory is available use ~/.dlt/pipelines
-        return os.path.join(home, DOT_DLT)
-
+        return os.path.join(_USER_HOME, DOT_DLT)
 
-def _get_user_home_dir() -> str:
-    return os.path.expanduser("~")
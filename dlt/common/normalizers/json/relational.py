@@ -1,9 +1,9 @@
 from functools import lru_cache
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple, cast, TypedDict, Any
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, cast, TypedDict, Any
 from dlt.common.json import json
 from dlt.common.normalizers.exceptions import InvalidJsonNormalizer
 from dlt.common.normalizers.typing import TJSONNormalizer
-from dlt.common.normalizers.utils import generate_dlt_id, DLT_ID_LENGTH_BYTES
+from dlt.common.normalizers.utils import generate_dlt_ids, DLT_ID_LENGTH_BYTES
 
 from dlt.common.typing import DictStrAny, DictStrStr, TDataItem, StrAny
 from dlt.common.schema import Schema
@@ -24,6 +24,7 @@ from dlt.common.normalizers.json import (
 from dlt.common.validation import validate_dict
 
 EMPTY_KEY_IDENTIFIER = "_empty"  # replace empty keys with this
+ROW_IDS_BATCH_SIZE = 64  # number of random row ids generated at once
 
 
 class TDataItemRow(TypedDict, total=False):
@@ -42,6 +43,13 @@ class TDataItemRowChild(TDataItemRow, total=False):
     value: Any  # for lists of simple types
 
 
+TChildItem = Tuple[
+    Any, Tuple[str, ...], Tuple[str, ...], Optional[str], Optional[int], int, Optional[str]
+]
+"""Item to normalize with its ident path, parent path, parent row id, list position, nesting level
+and precomputed row id for simple values"""
+
+
 class RelationalNormalizerConfigPropagation(TypedDict, total=False):
     root: Optional[Mapping[str, TColumnName]]
     tables: Optional[Mapping[str, Mapping[str, TColumnName]]]
@@ -58,6 +66,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
     propagation_config: RelationalNormalizerConfigPropagation
     max_nesting: int
     _skip_primary_key: Dict[str, bool]
+    _row_ids: List[str]
 
     def __init__(self, schema: Schema) -> None:
         """This item normalizer works with nested dictionaries. It flattens dictionaries and descends into lists.
@@ -72,6 +81,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         self.propagation_config = self.normalizer_config.get("propagation", None)
         self.max_nesting = self.normalizer_config.get("max_nesting", 1000)
         self._skip_primary_key = {}
+        self._row_ids = []
         # self.known_types: Dict[str, TDataType] = {}
         # self.primary_keys = Dict[str, ]
 
@@ -109,25 +119,41 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         out_rec_list: Dict[Tuple[str, ...], Sequence[Any]] = {}
         schema_naming = self.schema.naming
 
-        def norm_row_dicts(dict_row: StrAny, __r_lvl: int, path: Tuple[str, ...] = ()) -> None:
-            for k, v in dict_row.items():
+        # flatten nested dicts depth first with an explicit stack of dict item iterators so the
+        # order of the flattened keys is preserved and deep nesting does not recur
+        # each nested dict also keeps its path joined into a prefix, so the whole path is not
+        # joined again for every key
+        stack: List[Tuple[Iterator[Tuple[str, Any]], Tuple[str, ...], str, int]] = [
+            (iter(dict_row.items()), (), None, _r_lvl)
+        ]
+        while stack:
+            items, path, path_prefix, r_lvl = stack[-1]
+            for k, v in items:
                 if k.strip():
                     norm_k = schema_naming.normalize_identifier(k)
                 else:
                     # for empty keys in the data use _
                     norm_k = EMPTY_KEY_IDENTIFIER
-                # if norm_k != k:
-                #     print(f"{k} -> {norm_k}")
                 child_name = (
-                    norm_k if path == () else schema_naming.shorten_fragments(*path, norm_k)
+                    norm_k
+                    if path_prefix is None
+                    else schema_naming.shorten_fragments(path_prefix, norm_k)
                 )
                 # for lists and dicts we must check if type is possibly complex
                 if isinstance(v, (dict, list)):
-                    if not self._is_complex_type(table, child_name, __r_lvl):
+                    if not self._is_complex_type(table, child_name, r_lvl):
                         # TODO: if schema contains table {table}__{child_name} then convert v into single element list
                         if isinstance(v, dict):
-                            # flatten the dict more
-                            norm_row_dicts(v, __r_lvl + 1, path + (norm_k,))
+                            # flatten the dict more, continue with the current dict when done
+                            stack.append(
+                                (
+                                    iter(v.items()),
+                                    path + (norm_k,),
+                                    schema_naming.make_path(*path, norm_k),
+                                    r_lvl + 1,
+                                )
+                            )
+                            break
                         else:
                             # pass the list to out_rec_list
                             out_rec_list[path + (schema_naming.normalize_table_identifier(k),)] = v
@@ -137,8 +163,10 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
                         pass
 
                 out_rec_row[child_name] = v
+            else:
+                # all items of the dict were processed
+                stack.pop()
 
-        norm_row_dicts(dict_row, _r_lvl)
         return cast(TDataItemRow, out_rec_row), out_rec_list
 
     @staticmethod
@@ -159,6 +187,12 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         # and all child tables must be lists
         return digest128(f"{parent_row_id}_{child_table}_{list_idx}", DLT_ID_LENGTH_BYTES)
 
+    @staticmethod
+    def _get_child_row_hashes(parent_row_id: str, child_table: str, count: int) -> List[str]:
+        """Returns `_get_child_row_hash` for list positions 0..count-1, the common prefix is built once"""
+        prefix = f"{parent_row_id}_{child_table}_"
+        return [digest128(f"{prefix}{list_idx}", DLT_ID_LENGTH_BYTES) for list_idx in range(count)]
+
     @staticmethod
     def _link_row(row: TDataItemRowChild, parent_row_id: str, list_idx: int) -> TDataItemRowChild:
         assert parent_row_id
@@ -174,18 +208,24 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
     def _add_row_id(
         self, table: str, row: TDataItemRow, parent_row_id: str, pos: int, _r_lvl: int
     ) -> str:
-        # row_id is always random, no matter if primary_key is present or not
-        row_id = generate_dlt_id()
-        if _r_lvl > 0:
-            primary_key = self.schema.filter_row_with_hint(table, "primary_key", row)
-            if not primary_key:
-                # child table row deterministic hash
-                row_id = DataItemNormalizer._get_child_row_hash(parent_row_id, table, pos)
-                # link to parent table
-                DataItemNormalizer._link_row(cast(TDataItemRowChild, row), parent_row_id, pos)
+        if _r_lvl > 0 and not self.schema.filter_row_with_hint(table, "primary_key", row):
+            # child table row deterministic hash
+            row_id = DataItemNormalizer._get_child_row_hash(parent_row_id, table, pos)
+            # link to parent table
+            DataItemNormalizer._link_row(cast(TDataItemRowChild, row), parent_row_id, pos)
+        else:
+            # row_id is random, no matter if primary_key is present or not
+            row_id = self._new_row_id()
         row["_dlt_id"] = row_id
         return row_id
 
+    def _new_row_id(self) -> str:
+        """Takes random row id from a pool that is refilled in batches, so random bytes are not
+        requested from the OS for each row"""
+        if not self._row_ids:
+            self._row_ids = generate_dlt_ids(ROW_IDS_BATCH_SIZE)
+        return self._row_ids.pop()
+
     def _get_propagated_values(self, table: str, row: TDataItemRow, _r_lvl: int) -> StrAny:
         extend: DictStrAny = {}
 
@@ -204,44 +244,39 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
 
         return extend
 
-    # generate child tables only for lists
-    def _normalize_list(
+    def _iter_list_items(
         self,
-        seq: Sequence[Any],
-        extend: DictStrAny,
-        ident_path: Tuple[str, ...],
+        lists: Dict[Tuple[str, ...], Sequence[Any]],
         parent_path: Tuple[str, ...],
-        parent_row_id: Optional[str] = None,
-        _r_lvl: int = 0,
-    ) -> TNormalizedRowIterator:
-        v: TDataItemRowChild = None
-        table = self.schema.naming.shorten_fragments(*parent_path, *ident_path)
-
-        for idx, v in enumerate(seq):
-            # yield child table row
-            if isinstance(v, dict):
-                yield from self._normalize_row(
-                    v, extend, ident_path, parent_path, parent_row_id, idx, _r_lvl
-                )
-            elif isinstance(v, list):
-                # to normalize lists of lists, we must create a tracking intermediary table by creating a mock row
-                yield from self._normalize_row(
-                    {"list": v},
-                    extend,
-                    ident_path,
-                    parent_path,
-                    parent_row_id,
-                    idx,
-                    _r_lvl + 1,
-                )
-            else:
-                # list of simple types
-                child_row_hash = DataItemNormalizer._get_child_row_hash(parent_row_id, table, idx)
-                wrap_v = wrap_in_dict(v)
-                wrap_v["_dlt_id"] = child_row_hash
-                e = DataItemNormalizer._link_row(wrap_v, parent_row_id, idx)
-                DataItemNormalizer._extend_row(extend, e)
-                yield (table, self.schema.naming.shorten_fragments(*parent_path)), e
+        parent_row_id: str,
+        _r_lvl: int,
+    ) -> Iterator[TChildItem]:
+        """Generates child table items for all `lists` of a row in a form of
+        (item, ident_path, parent_path, parent_row_id, list_idx, recursion level, row id)"""
+        for ident_path, seq in lists.items():
+            child_row_hashes: Optional[List[str]] = None
+            for idx, v in enumerate(seq):
+                if isinstance(v, list):
+                    # to normalize lists of lists, we must create a tracking intermediary table by creating a mock row
+                    yield {"list": v}, ident_path, parent_path, parent_row_id, idx, _r_lvl + 1, None
+                elif isinstance(v, dict):
+                    yield v, ident_path, parent_path, parent_row_id, idx, _r_lvl, None
+                else:
+                    # hash all positions of a list of simple values at once
+                    if child_row_hashes is None:
+                        table = self.schema.naming.shorten_fragments(*parent_path, *ident_path)
+                        child_row_hashes = DataItemNormalizer._get_child_row_hashes(
+                            parent_row_id, table, len(seq)
+                        )
+                    yield (
+                        v,
+                        ident_path,
+                        parent_path,
+                        parent_row_id,
+                        idx,
+                        _r_lvl,
+                        child_row_hashes[idx],
+                    )
 
     def _normalize_row(
         self,
@@ -255,41 +290,62 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         row_hash: bool = False,
     ) -> TNormalizedRowIterator:
         schema = self.schema
-        table = schema.naming.shorten_fragments(*parent_path, *ident_path)
+        naming = schema.naming
         # compute row hash and set as row id
         if row_hash:
             row_id = self.get_row_hash(dict_row)  # type: ignore[arg-type]
             dict_row["_dlt_id"] = row_id
-        # flatten current row and extract all lists to recur into
-        flattened_row, lists = self._flatten(table, dict_row, _r_lvl)
-        # always extend row
-        DataItemNormalizer._extend_row(extend, flattened_row)
-        # infer record hash or leave existing primary key if present
-        row_id = flattened_row.get("_dlt_id", None)
-        if not row_id:
-            row_id = self._add_row_id(table, flattened_row, parent_row_id, pos, _r_lvl)
-
-        # find fields to propagate to child tables in config
-        extend.update(self._get_propagated_values(table, flattened_row, _r_lvl))
-
-        # yield parent table first
-        should_descend = yield (
-            (table, schema.naming.shorten_fragments(*parent_path)),
-            flattened_row,
-        )
-        if should_descend is False:
-            return
+        # table and parent table names per (parent path, ident path), so the names are built once
+        # per list and not for each list item
+        table_names: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Tuple[str, str]] = {}
+        # rows are normalized depth first using a stack of item iterators instead of recursion,
+        # child table items of a row are processed before the remaining items of the parent lists
+        stack: List[Iterator[TChildItem]] = [
+            iter(((dict_row, ident_path, parent_path, parent_row_id, pos, _r_lvl, None),))
+        ]
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:
+                stack.pop()
+                continue
+            v, ident_path, parent_path, parent_row_id, pos, _r_lvl, child_row_hash = item
+            names = table_names.get((parent_path, ident_path))
+            if names is None:
+                names = table_names[(parent_path, ident_path)] = (
+                    naming.shorten_fragments(*parent_path, *ident_path),
+                    naming.shorten_fragments(*parent_path),
+                )
+            table = names[0]
 
-        # normalize and yield lists
-        for list_path, list_content in lists.items():
-            yield from self._normalize_list(
-                list_content,
-                extend,
-                list_path,
-                parent_path + ident_path,
-                row_id,
-                _r_lvl + 1,
-            )
+            if not isinstance(v, dict):
+                # list of simple types
+                wrap_v = wrap_in_dict(v)
+                wrap_v["_dlt_id"] = child_row_hash
+                e = DataItemNormalizer._link_row(wrap_v, parent_row_id, pos)
+                DataItemNormalizer._extend_row(extend, e)
+                yield names, e
+                continue
+
+            # flatten current row and extract all lists to recur into
+            flattened_row, lists = self._flatten(table, v, _r_lvl)
+            # always extend row
+            DataItemNormalizer._extend_row(extend, flattened_row)
+            # infer record hash or leave existing primary key if present
+            row_id = flattened_row.get("_dlt_id", None)
+            if not row_id:
+                row_id = self._add_row_id(table, flattened_row, parent_row_id, pos, _r_lvl)
+
+            # find fields to propagate to child tables in config
+            if self.propagation_config:
+                extend.update(self._get_propagated_values(table, flattened_row, _r_lvl))
+
+            # yield parent table first
+            should_descend = yield names, flattened_row
+            if should_descend is False or not lists:
+                continue
+
+            # normalize and yield lists
+            stack.append(self._iter_list_items(lists, parent_path + ident_path, row_id, _r_lvl + 1))
 
     def extend_schema(self) -> None:
         # validate config
@@ -326,6 +382,12 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         # if the table has a merge w_d, add propagation info to normalizer
         table = self.schema.tables.get(table_name)
         if not table.get("parent") and table.get("write_disposition") == "merge":
+            # update_table calls this for every schema change, skip validation and merge of the config
+            # if root id propagation is already present
+            propagation = DataItemNormalizer.get_normalizer_config(self.schema).get("propagation")
+            table_propagation = ((propagation or {}).get("tables") or {}).get(table_name) or {}
+            if table_propagation.get("_dlt_id") == "_dlt_root_id":
+                return
             DataItemNormalizer.update_normalizer_config(
                 self.schema,
                 {"propagation": {"tables": {table_name: {"_dlt_id": TColumnName("_dlt_root_id")}}}},
@@ -56,6 +56,9 @@ class NamingConvention(ABC):
         if not normalized_idents:
             return None
         path_str = self.make_path(*normalized_idents)
+        if not self.max_length:
+            # nothing to shorten, skip the cached shortening call keyed by the whole path
+            return path_str
         return self.shorten_identifier(path_str, path_str, self.max_length)
 
     @staticmethod
@@ -79,6 +79,9 @@ CREDENTIALS_DISPATCH: Dict[str, Callable[[FilesystemConfiguration], DictStrAny]]
     "azure": lambda config: cast(AzureCredentials, config.credentials).to_adlfs_credentials(),
 }
 
+S3_MAX_POOL_CONNECTIONS = 50
+"""Default size of botocore connection pool used by s3fs, botocore default of 10 is too low for parallel uploads"""
+
 
 def fsspec_filesystem(
     protocol: str,
@@ -128,6 +131,12 @@ def prepare_fsspec_args(config: FilesystemConfiguration) -> DictStrAny:
     if "client_kwargs" in fs_kwargs and "client_kwargs" in credentials:
         fs_kwargs["client_kwargs"].update(credentials.pop("client_kwargs"))
 
+    if protocol in ("s3", "s3a"):
+        # allow parallel jobs to share a larger connection pool of the cached s3fs instance
+        config_kwargs = {"max_pool_connections": S3_MAX_POOL_CONNECTIONS}
+        config_kwargs.update(fs_kwargs.get("config_kwargs") or {})
+        fs_kwargs["config_kwargs"] = config_kwargs
+
     fs_kwargs.update(credentials)
     return fs_kwargs
 
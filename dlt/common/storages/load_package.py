@@ -355,21 +355,27 @@ class PackageStorage:
         return [job for job in flatten_list_or_items(iter(info.jobs.values()))]  # type: ignore
 
     def list_failed_jobs_infos(self, load_id: str) -> Sequence[LoadJobInfo]:
-        """List all failed jobs and associated error messages for a load package with `load_id`"""
+        """List all failed jobs and associated error messages for a load package with `load_id`
+
+        Only the failed jobs folder is read, package schema and other jobs are not loaded.
+        """
         failed_jobs: List[LoadJobInfo] = []
         package_path = self.get_package_path(load_id)
-        package_created_at = pendulum.from_timestamp(
-            os.path.getmtime(
-                self.storage.make_full_path(
-                    os.path.join(package_path, PackageStorage.PACKAGE_COMPLETED_FILE_NAME)
-                )
+        if not self.storage.has_folder(package_path):
+            raise LoadPackageNotFound(load_id)
+        package_created_at: DateTime = None
+        # only completed packages have creation time
+        completed_file_path = os.path.join(package_path, PackageStorage.PACKAGE_COMPLETED_FILE_NAME)
+        if self.storage.has_file(completed_file_path):
+            package_created_at = pendulum.from_timestamp(
+                os.path.getmtime(self.storage.make_full_path(completed_file_path))
             )
-        )
-        for file in self.list_failed_jobs(load_id):
-            if not file.endswith(".exception"):
-                failed_jobs.append(
-                    self._read_job_file_info("failed_jobs", file, package_created_at)
-                )
+        with contextlib.suppress(FileNotFoundError):
+            for file in self.list_failed_jobs(load_id):
+                if not file.endswith(".exception"):
+                    failed_jobs.append(
+                        self._read_job_file_info("failed_jobs", file, package_created_at)
+                    )
         return failed_jobs
 
     #
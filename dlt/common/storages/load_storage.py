@@ -126,6 +126,13 @@ class LoadStorage(VersionedStorage):
         """List all failed jobs and associated error messages for a completed load package with `load_id`"""
         return self.loaded_packages.list_failed_jobs_infos(load_id)
 
+    def list_failed_jobs_in_package(self, load_id: str) -> Sequence[LoadJobInfo]:
+        """List all failed jobs and associated error messages for a normalized OR loaded package with `load_id`"""
+        try:
+            return self.loaded_packages.list_failed_jobs_infos(load_id)
+        except LoadPackageNotFound:
+            return self.normalized_packages.list_failed_jobs_infos(load_id)
+
     def begin_schema_update(self, load_id: str) -> Optional[TSchemaTables]:
         package_path = self.get_normalized_package_path(load_id)
         if not self.storage.has_folder(package_path):
@@ -22,6 +22,8 @@ class FilesystemDestinationClientConfiguration(FilesystemConfiguration, Destinat
     )
     current_datetime: Optional[TCurrentDateTime] = None
     extra_placeholders: Optional[TExtraPlaceholders] = None
+    upload_concurrency: Optional[int] = None
+    """Max number of parts of a single file uploaded concurrently, if supported by the fsspec implementation. Uses fsspec default if not set"""
 
     @resolve_type("credentials")
     def resolve_credentials_type(self) -> Type[CredentialsConfiguration]:
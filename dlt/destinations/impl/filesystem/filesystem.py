@@ -1,7 +1,10 @@
 import posixpath
+import re
 import pathlib
 import os
 import base64
+import inspect
+from functools import lru_cache
 from types import TracebackType
 from typing import ClassVar, List, Type, Iterable, Set, Iterator, Optional, Tuple, cast
 from fsspec import AbstractFileSystem
@@ -36,6 +39,28 @@ from dlt.destinations.fs_client import FSClientBase
 
 INIT_FILE_NAME = "init"
 FILENAME_SEPARATOR = "__"
+# bucket protocols that accept a list of paths in `rm` and delete them with bulk requests
+BULK_DELETE_PROTOCOLS = {"s3", "gs", "gcs", "az", "abfs", "adl"}
+# max number of keys in a single bulk delete request
+BULK_DELETE_CHUNK_SIZE = 1000
+
+
+@lru_cache(maxsize=None)
+def _put_file_supports_max_concurrency(fs_class: Type[AbstractFileSystem]) -> bool:
+    """Tells if `put_file` of async fsspec implementation uploads parts concurrently (ie. s3fs, adlfs)"""
+    put_file = getattr(fs_class, "_put_file", None)
+    if put_file is None:
+        return False
+    try:
+        return "max_concurrency" in inspect.signature(put_file).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=128)
+def _to_path_safe_string(s: str) -> str:
+    """for base64 strings"""
+    return base64.b64decode(s).hex() if s else None
 
 
 class LoadFilesystemJob(LoadJob):
@@ -45,8 +70,10 @@ class LoadFilesystemJob(LoadJob):
         dataset_path: str,
         *,
         config: FilesystemDestinationClientConfiguration,
+        path_builder: path_utils.TPathBuilder,
         schema_name: str,
         load_id: str,
+        load_package_timestamp: pendulum.DateTime,
     ) -> None:
         file_name = FileStorage.get_file_name_from_file_path(local_path)
         self.config = config
@@ -54,14 +81,12 @@ class LoadFilesystemJob(LoadJob):
         self.is_local_filesystem = config.protocol == "file"
         # pick local filesystem pathlib or posix for buckets
         self.pathlib = os.path if self.is_local_filesystem else posixpath
-        self.destination_file_name = path_utils.create_path(
-            config.layout,
+        self.destination_file_name = path_builder(
             file_name,
             schema_name,
             load_id,
-            current_datetime=config.current_datetime,
-            load_package_timestamp=dlt.current.load_package()["state"]["created_at"],
-            extra_placeholders=config.extra_placeholders,
+            load_package_timestamp,
+            config.current_datetime,
         )
 
         super().__init__(file_name)
@@ -73,7 +98,10 @@ class LoadFilesystemJob(LoadJob):
         item = self.make_remote_path()
         if self.is_local_filesystem:
             fs_client.makedirs(self.pathlib.dirname(item), exist_ok=True)
-        fs_client.put_file(local_path, item)
+        if config.upload_concurrency and _put_file_supports_max_concurrency(type(fs_client)):
+            fs_client.put_file(local_path, item, max_concurrency=config.upload_concurrency)
+        else:
+            fs_client.put_file(local_path, item)
 
     def make_remote_path(self) -> str:
         """Returns path on the remote filesystem to which copy the file, without scheme. For local filesystem a native path is used"""
@@ -134,11 +162,16 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
         # verify files layout. we need {table_name} and only allow {schema_name} before it, otherwise tables
         # cannot be replaced and we cannot initialize folders consistently
         self.table_prefix_layout = path_utils.get_table_prefix_layout(config.layout)
+        # validate the layout once and reuse it for all jobs
+        self._path_builder = path_utils.compile_layout(config.layout, config.extra_placeholders)
         self.dataset_name = self.config.normalize_dataset_name(self.schema)
+        # paths known to exist, folders and init files are not deleted during the session
+        self._existing_paths: Set[str] = set()
 
     def drop_storage(self) -> None:
         if self.is_storage_initialized():
             self.fs_client.rm(self.dataset_path, recursive=True)
+        self._existing_paths.clear()
 
     @property
     def dataset_path(self) -> str:
@@ -176,9 +209,13 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
         table_dirs = set(self.get_table_dirs(table_names))
         table_prefixes = [self.get_table_prefix(t) for t in table_names]
         for table_dir in table_dirs:
-            for table_file in self.list_files_with_prefixes(table_dir, table_prefixes):
-                # NOTE: deleting in chunks on s3 does not raise on access denied, file non existing and probably other errors
-                # print(f"DEL {table_file}")
+            table_files = self.list_files_with_prefixes(table_dir, table_prefixes)
+            if not table_files:
+                continue
+            if self.config.protocol in BULK_DELETE_PROTOCOLS:
+                self._bulk_delete_files(table_dir, table_prefixes, table_files)
+                continue
+            for table_file in table_files:
                 try:
                     # NOTE: must use rm_file to get errors on delete
                     self.fs_client.rm_file(table_file)
@@ -193,6 +230,20 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
                         " it should have been created previously!"
                     )
 
+    def _bulk_delete_files(
+        self, table_dir: str, table_prefixes: List[str], table_files: List[str]
+    ) -> None:
+        """Deletes `table_files` with bulk requests and checks that all of them are gone"""
+        for idx in range(0, len(table_files), BULK_DELETE_CHUNK_SIZE):
+            self.fs_client.rm(table_files[idx : idx + BULK_DELETE_CHUNK_SIZE])
+        # NOTE: deleting in chunks on s3 does not raise on access denied, file non existing and
+        # probably other errors so we list the folder again instead of checking each file
+        not_deleted = set(table_files).intersection(
+            self.list_files_with_prefixes(table_dir, table_prefixes)
+        )
+        if not_deleted:
+            raise FileExistsError(sorted(not_deleted)[0])
+
     def update_stored_schema(
         self,
         only_tables: Iterable[str] = None,
@@ -201,11 +252,18 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
         # create destination dirs for all tables
         table_names = only_tables or self.schema.tables.keys()
         dirs_to_create = self.get_table_dirs(table_names)
+        dlt_table_names = set(self.schema.dlt_table_names())
         for tables_name, directory in zip(table_names, dirs_to_create):
-            self.fs_client.makedirs(directory, exist_ok=True)
+            # many tables may share a directory, create it once per session
+            if directory not in self._existing_paths:
+                self.fs_client.makedirs(directory, exist_ok=True)
+                self._existing_paths.add(directory)
             # we need to mark the folders of the data tables as initialized
-            if tables_name in self.schema.dlt_table_names():
-                self.fs_client.touch(self.pathlib.join(directory, INIT_FILE_NAME))
+            if tables_name in dlt_table_names:
+                init_file = self.pathlib.join(directory, INIT_FILE_NAME)
+                if init_file not in self._existing_paths:
+                    self.fs_client.touch(init_file)
+                    self._existing_paths.add(init_file)
 
         # don't store schema when used as staging
         if not self.config.as_staging:
@@ -245,23 +303,37 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
 
     def list_files_with_prefixes(self, table_dir: str, prefixes: List[str]) -> List[str]:
         """returns all files in a directory that match given prefixes"""
-        result = []
-        for current_dir, _dirs, files in self.fs_client.walk(table_dir, detail=False, refresh=True):
-            for file in files:
-                # skip INIT files
-                if file == INIT_FILE_NAME:
-                    continue
-                filepath = self.pathlib.join(
-                    path_utils.normalize_path_sep(self.pathlib, current_dir), file
-                )
-                for p in prefixes:
-                    if filepath.startswith(p):
-                        result.append(filepath)
-                        break
+        result: List[str] = []
+        if not prefixes:
+            return result
+        # match all prefixes with a single compiled pattern
+        match_prefix = re.compile("|".join(re.escape(p) for p in prefixes)).match
+        # bind lookups used per file
+        pathlib = self.pathlib
+        basename = pathlib.basename
+        normalize_path_sep = path_utils.normalize_path_sep
+        # find lists the whole tree in one go (ie. a single LIST without delimiter on buckets)
+        # instead of a listing per directory done by walk
+        for filepath in self.fs_client.find(table_dir, detail=False, refresh=True):
+            filepath = normalize_path_sep(pathlib, filepath)
+            # skip INIT files
+            if basename(filepath) == INIT_FILE_NAME:
+                continue
+            if match_prefix(filepath):
+                result.append(filepath)
         return result
 
     def is_storage_initialized(self) -> bool:
-        return self.fs_client.exists(self.pathlib.join(self.dataset_path, INIT_FILE_NAME))  # type: ignore[no-any-return]
+        return self._path_exists(self.pathlib.join(self.dataset_path, INIT_FILE_NAME))
+
+    def _path_exists(self, path: str, is_dir: bool = False) -> bool:
+        """Checks if file or directory (`is_dir`) `path` exists. Remembers positive results"""
+        if path in self._existing_paths:
+            return True
+        exists = self.fs_client.isdir(path) if is_dir else self.fs_client.exists(path)
+        if exists:
+            self._existing_paths.add(path)
+        return exists  # type: ignore[no-any-return]
 
     def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
         # skip the state table, we create a jsonl file in the complete_load step
@@ -275,8 +347,10 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
             file_path,
             self.dataset_path,
             config=self.config,
+            path_builder=self._path_builder,
             schema_name=self.schema.name,
             load_id=load_id,
+            load_package_timestamp=dlt.current.load_package()["state"]["created_at"],
         )
 
     def restore_file_load(self, file_path: str) -> LoadJob:
@@ -299,17 +373,14 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
 
     def _write_to_json_file(self, filepath: str, data: DictStrAny) -> None:
         dirname = self.pathlib.dirname(filepath)
-        if not self.fs_client.isdir(dirname):
+        if not self._path_exists(dirname, is_dir=True):
             return
-        self.fs_client.write_text(filepath, json.dumps(data), "utf-8")
-
-    def _to_path_safe_string(self, s: str) -> str:
-        """for base64 strings"""
-        return base64.b64decode(s).hex() if s else None
+        # write serialized bytes directly, without decoding and encoding them again
+        self.fs_client.pipe_file(filepath, json.dumpb(data))
 
     def _list_dlt_table_files(self, table_name: str) -> Iterator[Tuple[str, List[str]]]:
         dirname = self.get_table_dir(table_name)
-        if not self.fs_client.exists(self.pathlib.join(dirname, INIT_FILE_NAME)):
+        if not self._path_exists(self.pathlib.join(dirname, INIT_FILE_NAME)):
             raise DestinationUndefinedEntity({"dir": dirname})
         for filepath in self.list_table_files(table_name):
             filename = os.path.splitext(os.path.basename(filepath))[0]
@@ -318,6 +389,18 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
                 continue
             yield filepath, fileparts
 
+    def _newest_dlt_table_file(self, table_name: str, name: str) -> Optional[str]:
+        """Returns path of file with the highest load id among files of dlt table `table_name` written for `name`"""
+        newest = max(
+            (
+                (fileparts[1], filepath)
+                for filepath, fileparts in self._list_dlt_table_files(table_name)
+                if fileparts[0] == name
+            ),
+            default=None,
+        )
+        return newest[1] if newest else None
+
     def _store_load(self, load_id: str) -> None:
         # write entry to load "table"
         # TODO: this is also duplicate across all destinations. DRY this.
@@ -348,7 +431,7 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
         """gets full path for schema file for a given hash"""
         return self.pathlib.join(  # type: ignore[no-any-return]
             self.get_table_dir(self.schema.state_table_name),
-            f"{pipeline_name}{FILENAME_SEPARATOR}{load_id}{FILENAME_SEPARATOR}{self._to_path_safe_string(version_hash)}.jsonl",
+            f"{pipeline_name}{FILENAME_SEPARATOR}{load_id}{FILENAME_SEPARATOR}{_to_path_safe_string(version_hash)}.jsonl",
         )
 
     def _store_current_state(self, load_id: str) -> None:
@@ -373,13 +456,8 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
         self._write_to_json_file(hash_path, cast(DictStrAny, pipeline_state_doc))
 
     def get_stored_state(self, pipeline_name: str) -> Optional[StateInfo]:
-        # search newest state
-        selected_path = None
-        newest_load_id = "0"
-        for filepath, fileparts in self._list_dlt_table_files(self.schema.state_table_name):
-            if fileparts[0] == pipeline_name and fileparts[1] > newest_load_id:
-                newest_load_id = fileparts[1]
-                selected_path = filepath
+        # search newest state, file parts are (pipeline_name, load_id, hash)
+        selected_path = self._newest_dlt_table_file(self.schema.state_table_name, pipeline_name)
 
         # Load compressed state from destination
         if selected_path:
@@ -398,28 +476,35 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
 
         return self.pathlib.join(  # type: ignore[no-any-return]
             self.get_table_dir(self.schema.version_table_name),
-            f"{self.schema.name}{FILENAME_SEPARATOR}{load_id}{FILENAME_SEPARATOR}{self._to_path_safe_string(version_hash)}.jsonl",
+            f"{self.schema.name}{FILENAME_SEPARATOR}{load_id}{FILENAME_SEPARATOR}{_to_path_safe_string(version_hash)}.jsonl",
         )
 
     def _get_stored_schema_by_hash_or_newest(
         self, version_hash: str = None
     ) -> Optional[StorageSchemaInfo]:
         """Get the schema by supplied hash, falls back to getting the newest version matching the existing schema name"""
-        version_hash = self._to_path_safe_string(version_hash)
-        # find newest schema for pipeline or by version hash
-        selected_path = None
-        newest_load_id = "0"
-        for filepath, fileparts in self._list_dlt_table_files(self.schema.version_table_name):
-            if (
-                not version_hash
-                and fileparts[0] == self.schema.name
-                and fileparts[1] > newest_load_id
-            ):
-                newest_load_id = fileparts[1]
-                selected_path = filepath
-            elif fileparts[2] == version_hash:
-                selected_path = filepath
-                break
+        version_hash = _to_path_safe_string(version_hash)
+        # find newest schema for pipeline or by version hash, file parts are (schema_name, load_id, hash)
+        if version_hash:
+            dirname = self.get_table_dir(self.schema.version_table_name)
+            if not self._path_exists(self.pathlib.join(dirname, INIT_FILE_NAME)):
+                raise DestinationUndefinedEntity({"dir": dirname})
+            # hash is a part of the file name so glob only the matching files
+            pattern = self.pathlib.join(
+                dirname, f"*{FILENAME_SEPARATOR}*{FILENAME_SEPARATOR}{version_hash}.*"
+            )
+            selected_path = None
+            for filepath in self.fs_client.glob(pattern):
+                filepath = path_utils.normalize_path_sep(self.pathlib, filepath)
+                filename = os.path.splitext(os.path.basename(filepath))[0]
+                fileparts = filename.split(FILENAME_SEPARATOR)
+                if len(fileparts) == 3 and fileparts[2] == version_hash:
+                    selected_path = filepath
+                    break
+        else:
+            selected_path = self._newest_dlt_table_file(
+                self.schema.version_table_name, self.schema.name
+            )
 
         if selected_path:
             return StorageSchemaInfo(**json.loads(self.fs_client.read_text(selected_path)))
@@ -1,5 +1,5 @@
 import re
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from dlt.common import logger
 from dlt.common.pendulum import pendulum
@@ -99,6 +99,7 @@ def get_unused_placeholders(
 def prepare_datetime_params(
     current_datetime: Optional[pendulum.DateTime] = None,
     load_package_timestamp: Optional[pendulum.DateTime] = None,
+    datetime_placeholders: Iterable[str] = DATETIME_PLACEHOLDERS,
 ) -> Dict[str, str]:
     params: Dict[str, str] = {}
     current_timestamp: pendulum.DateTime = None
@@ -119,7 +120,7 @@ def prepare_datetime_params(
     params["timestamp_ms"] = str(datetime_to_timestamp_ms(current_datetime))
     params["curr_date"] = str(current_datetime.date())
 
-    for format_string in DATETIME_PLACEHOLDERS:
+    for format_string in datetime_placeholders:
         params[format_string] = current_datetime.format(format_string).lower()
 
     return params
@@ -209,6 +210,57 @@ def check_layout(
     return list(all_placeholders), placeholders
 
 
+TPathBuilder = Callable[
+    [str, str, str, Optional[pendulum.DateTime], Optional[TCurrentDateTime]], str
+]
+"""Creates a path from `file_name`, `schema_name`, `load_id`, `load_package_timestamp` and `current_datetime`"""
+
+
+def compile_layout(layout: str, extra_placeholders: Optional[Dict[str, Any]] = None) -> TPathBuilder:
+    """Validates `layout` once and returns a function that creates paths for it. Only date time
+    placeholders present in the layout are formatted when the path is created.
+
+    Raises: InvalidFilesystemLayout
+    """
+    placeholders, layout_placeholders = check_layout(layout, extra_placeholders)
+    datetime_placeholders = [p for p in DATETIME_PLACEHOLDERS if p in layout_placeholders]
+    append_ext = "ext" not in placeholders
+
+    def _create_path(
+        file_name: str,
+        schema_name: str,
+        load_id: str,
+        load_package_timestamp: Optional[pendulum.DateTime] = None,
+        current_datetime: Optional[TCurrentDateTime] = None,
+    ) -> str:
+        if callable(current_datetime):
+            current_datetime = current_datetime()
+            if not isinstance(current_datetime, pendulum.DateTime):
+                raise RuntimeError(
+                    "current_datetime is not an instance instance of pendulum.DateTime"
+                )
+
+        job_info = ParsedLoadJobFileName.parse(file_name)
+        params = prepare_params(
+            extra_placeholders=extra_placeholders,
+            job_info=job_info,
+            schema_name=schema_name,
+            load_id=load_id,
+        )
+        params.update(
+            prepare_datetime_params(current_datetime, load_package_timestamp, datetime_placeholders)
+        )
+        path = layout.format_map(params)
+
+        # if extension is not defined, we append it at the end
+        if append_ext:
+            path += f".{job_info.file_format}"
+
+        return path
+
+    return _create_path
+
+
 def create_path(
     layout: str,
     file_name: str,
@@ -219,31 +271,10 @@ def create_path(
     extra_placeholders: Optional[Dict[str, Any]] = None,
 ) -> str:
     """create a filepath from the layout and our default params"""
-    if callable(current_datetime):
-        current_datetime = current_datetime()
-        if not isinstance(current_datetime, pendulum.DateTime):
-            raise RuntimeError("current_datetime is not an instance instance of pendulum.DateTime")
-
-    job_info = ParsedLoadJobFileName.parse(file_name)
-    params = prepare_params(
-        extra_placeholders=extra_placeholders,
-        job_info=job_info,
-        schema_name=schema_name,
-        load_id=load_id,
+    return compile_layout(layout, extra_placeholders)(
+        file_name, schema_name, load_id, load_package_timestamp, current_datetime
     )
 
-    datetime_params = prepare_datetime_params(current_datetime, load_package_timestamp)
-    params.update(datetime_params)
-
-    placeholders, _ = check_layout(layout, params)
-    path = layout.format(**params)
-
-    # if extension is not defined, we append it at the end
-    if "ext" not in placeholders:
-        path += f".{job_info.file_format}"
-
-    return path
-
 
 def get_table_prefix_layout(
     layout: str,
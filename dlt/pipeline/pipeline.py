@@ -883,7 +883,7 @@ class Pipeline(SupportsPipeline):
 
     def list_failed_jobs_in_package(self, load_id: str) -> Sequence[LoadJobInfo]:
         """List all failed jobs and associated error messages for a specified `load_id`"""
-        return self._get_load_storage().get_load_package_info(load_id).jobs.get("failed_jobs", [])
+        return self._get_load_storage().list_failed_jobs_in_package(load_id)
 
     def drop_pending_packages(self, with_partial_loads: bool = True) -> None:
         """Deletes all extracted and normalized packages, including those that are partially loaded by default"""
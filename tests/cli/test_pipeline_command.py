@@ -4,6 +4,7 @@ import contextlib
 import pytest
 import logging
 from subprocess import CalledProcessError
+from unittest.mock import patch
 
 import dlt
 from dlt.common.runners.venv import Venv
@@ -11,6 +12,7 @@ from dlt.common.storages.file_storage import FileStorage
 
 from dlt.cli import echo, init_command, pipeline_command
 
+from tests.utils import TEST_STORAGE_ROOT
 from tests.cli.utils import (
     echo_default_choice,
     repo_dir,
@@ -62,8 +64,8 @@ def test_pipeline_command_operations(repo_dir: str, project_files: FileStorage)
     with io.StringIO() as buf, contextlib.redirect_stdout(buf):
         pipeline_command.pipeline_command("info", "chess_pipeline", None, 1)
         _out = buf.getvalue()
-        # were the sources state displayed
-        assert '"chess": {' in _out
+        # were the sources state displayed, compact json because stdout is not a tty
+        assert '"chess":{' in _out
     print(_out)
 
     with io.StringIO() as buf, contextlib.redirect_stdout(buf):
@@ -231,3 +233,27 @@ def test_pipeline_command_drop_partial_loads(repo_dir: str, project_files: FileS
         _out = buf.getvalue()
         assert "No pending packages found" in _out
     print(_out)
+
+
+def test_pipeline_command_list_does_not_attach() -> None:
+    pipelines_dir = os.path.join(TEST_STORAGE_ROOT, "list_pipelines")
+    os.makedirs(os.path.join(pipelines_dir, "pipeline_1"))
+    os.makedirs(os.path.join(pipelines_dir, "pipeline_2"))
+    # files are not pipelines
+    with open(os.path.join(pipelines_dir, "file.txt"), "w", encoding="utf-8") as f:
+        f.write("not a pipeline")
+
+    with patch.object(dlt, "attach", side_effect=AssertionError("list must not attach")):
+        with io.StringIO() as buf, contextlib.redirect_stdout(buf):
+            pipeline_command.pipeline_command("list", "-", pipelines_dir, 0)
+            _out = buf.getvalue()
+        assert "2 pipelines found" in _out
+        assert set(_out.splitlines()[1:]) == {"pipeline_1", "pipeline_2"}
+
+        # missing pipelines dir
+        with io.StringIO() as buf, contextlib.redirect_stdout(buf):
+            pipeline_command.pipeline_command(
+                "list", "-", os.path.join(TEST_STORAGE_ROOT, "no_pipelines"), 0
+            )
+            _out = buf.getvalue()
+        assert "No pipelines found" in _out
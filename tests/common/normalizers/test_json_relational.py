@@ -1,4 +1,6 @@
 import pytest
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
 
 from dlt.common.typing import StrAny, DictStrAny
 from dlt.common.normalizers.naming import NamingConvention
@@ -97,8 +99,9 @@ def test_child_table_linking(norm: RelationalNormalizer) -> None:
     rows = list(norm._normalize_row(row, {}, ("table",)))  # type: ignore[arg-type]
     # should have 7 entries (root + level 1 + 3 * list + 2 * object)
     assert len(rows) == 7
+    by_table = index_rows(rows)
     # root elem will not have a root hash if not explicitly added, "extend" is added only to child
-    root_row = next(t for t in rows if t[0][0] == "table")
+    root_row = by_table["table"][0]
     # root row must have parent table none
     assert root_row[0][1] is None
 
@@ -117,12 +120,12 @@ def test_child_table_linking(norm: RelationalNormalizer) -> None:
     assert all("_dlt_parent_id" in e[1] for e in rows if e[0][0] != "table")
     assert all("_dlt_list_idx" in e[1] for e in rows if e[0][0] != "table")
     # filter 3 entries with list
-    list_rows = [t for t in rows if t[0][0] == "table__f__l"]
+    list_rows = by_table["table__f__l"]
     assert len(list_rows) == 3
     # all list rows must have table_f as parent
     assert all(r[0][1] == "table__f" for r in list_rows)
     # get parent for list
-    f_row = next(t for t in rows if t[0][0] == "table__f")
+    f_row = by_table["table__f"][0]
     # parent of the list must be "table"
     assert f_row[0][1] == "table"
     f_row_v = f_row[1]
@@ -143,25 +146,26 @@ def test_child_table_linking_primary_key(norm: RelationalNormalizer) -> None:
     norm.schema._compile_settings()
 
     rows = list(norm._normalize_row(row, {}, ("table",)))  # type: ignore[arg-type]
-    root = next(t for t in rows if t[0][0] == "table")[1]
+    by_table = index_rows(rows)
+    root = by_table["table"][0][1]
     # record hash is random for primary keys, not based on their content
     # this is a change introduced in dlt 0.2.0a30
     assert root["_dlt_id"] != digest128("level0", DLT_ID_LENGTH_BYTES)
 
     # table at "f"
-    t_f = next(t for t in rows if t[0][0] == "table__f")[1]
+    t_f = by_table["table__f"][0][1]
     assert t_f["_dlt_id"] != digest128("level1", DLT_ID_LENGTH_BYTES)
     # we use primary key to link to parent
     assert "_dlt_parent_id" not in t_f
     assert "_dlt_list_idx" not in t_f
     assert "_dlt_root_id" not in t_f
 
-    list_rows = [t for t in rows if t[0][0] == "table__f__l"]
+    list_rows = by_table["table__f__l"]
     assert all(
         e[1]["_dlt_parent_id"] != digest128("level1", DLT_ID_LENGTH_BYTES) for e in list_rows
     )
     assert all(r[0][1] == "table__f" for r in list_rows)
-    obj_rows = [t for t in rows if t[0][0] == "table__f__o"]
+    obj_rows = by_table["table__f__o"]
     assert all(e[1]["_dlt_parent_id"] != digest128("level1", DLT_ID_LENGTH_BYTES) for e in obj_rows)
     assert all(r[0][1] == "table__f" for r in obj_rows)
 
@@ -280,8 +284,9 @@ def test_list_position(norm: RelationalNormalizer) -> None:
         "f": [{"l": ["a", "b", "c"], "v": 120, "lo": [{"e": "a"}, {"e": "b"}, {"e": "c"}]}]
     }
     rows = list(norm._normalize_row(row, {}, ("table",)))  # type: ignore[arg-type]
+    by_table = index_rows(rows)
     # root has no pos
-    root = [t for t in rows if t[0][0] == "table"][0][1]
+    root = by_table["table"][0][1]
     assert "_dlt_list_idx" not in root
 
     # all other have pos
@@ -289,14 +294,14 @@ def test_list_position(norm: RelationalNormalizer) -> None:
     assert all("_dlt_list_idx" in e[1] for e in others)
 
     # f_l must be ordered as it appears in the list
+    f_l_by_value = {r["value"]: r for _, r in by_table["table__f__l"]}
     for pos, elem in enumerate(["a", "b", "c"]):
-        row = next(t[1] for t in rows if t[0][0] == "table__f__l" and t[1]["value"] == elem)
-        assert row["_dlt_list_idx"] == pos
+        assert f_l_by_value[elem]["_dlt_list_idx"] == pos
 
     # f_lo must be ordered - list of objects
+    f_lo_by_e = {r["e"]: r for _, r in by_table["table__f__lo"]}
     for pos, elem in enumerate(["a", "b", "c"]):
-        row = next(t[1] for t in rows if t[0][0] == "table__f__lo" and t[1]["e"] == elem)
-        assert row["_dlt_list_idx"] == pos
+        assert f_lo_by_e[elem]["_dlt_list_idx"] == pos
 
 
 # def test_list_of_lists(norm: RelationalNormalizer) -> None:
@@ -444,9 +449,17 @@ def test_child_row_deterministic_hash(norm: RelationalNormalizer) -> None:
         assert ch["_dlt_id"] == expected_hash
 
     # direct compute one of the
-    el_f = next(t[1] for t in rows if t[0][0] == "table__f" and t[1]["_dlt_list_idx"] == 0)
-    f_lo_p2 = next(t[1] for t in rows if t[0][0] == "table__f__lo" and t[1]["_dlt_list_idx"] == 2)
+    by_table = index_rows(rows)
+    el_f = by_table["table__f"][0][1]
+    assert el_f["_dlt_list_idx"] == 0
+    f_lo_p2 = by_table["table__f__lo"][2][1]
+    assert f_lo_p2["_dlt_list_idx"] == 2
     assert f_lo_p2["_dlt_id"] == digest128(f"{el_f['_dlt_id']}_table__f__lo_2", DLT_ID_LENGTH_BYTES)
+    # batch hashes are identical to hashes computed per list position
+    assert RelationalNormalizer._get_child_row_hashes(el_f["_dlt_id"], "table__f__l", 3) == [
+        RelationalNormalizer._get_child_row_hash(el_f["_dlt_id"], "table__f__l", idx)
+        for idx in range(3)
+    ]
 
     # same data with same table and row_id
     rows_2 = list(norm._normalize_row(row, {}, ("table",)))  # type: ignore[arg-type]
@@ -741,14 +754,15 @@ def test_parse_with_primary_key() -> None:
 
     row = {"id": "817949077341208606", "w_id": [{"id": 9128918293891111, "wo_id": [1, 2, 3]}]}
     rows = list(schema.normalize_data_item(row, "load_id", "discord"))
+    by_table = index_rows(rows)
     # get root
-    root = next(t[1] for t in rows if t[0][0] == "discord")
+    root = by_table["discord"][0][1]
     assert root["_dlt_id"] != digest128("817949077341208606", DLT_ID_LENGTH_BYTES)
     assert "_dlt_parent_id" not in root
     assert "_dlt_root_id" not in root
     assert root["_dlt_load_id"] == "load_id"
 
-    el_w_id = next(t[1] for t in rows if t[0][0] == "discord__w_id")
+    el_w_id = by_table["discord__w_id"][0][1]
     # this also has primary key
     assert el_w_id["_dlt_id"] != digest128("9128918293891111", DLT_ID_LENGTH_BYTES)
     assert "_dlt_parent_id" not in el_w_id
@@ -757,9 +771,8 @@ def test_parse_with_primary_key() -> None:
     assert "_dlt_root_id" in el_w_id
 
     # this must have deterministic child key
-    f_wo_id = next(
-        t[1] for t in rows if t[0][0] == "discord__w_id__wo_id" and t[1]["_dlt_list_idx"] == 2
-    )
+    f_wo_id = by_table["discord__w_id__wo_id"][2][1]
+    assert f_wo_id["_dlt_list_idx"] == 2
     assert f_wo_id["value"] == 3
     assert f_wo_id["_dlt_root_id"] != digest128("817949077341208606", DLT_ID_LENGTH_BYTES)
     assert f_wo_id["_dlt_parent_id"] != digest128("9128918293891111", DLT_ID_LENGTH_BYTES)
@@ -848,6 +861,11 @@ def test_propagation_update_on_table_change(norm: RelationalNormalizer):
     assert norm.schema._normalizers_config["json"]["config"]["propagation"]["tables"][
         table_1["name"]
     ] == {"_dlt_id": "_dlt_root_id"}
+    # updating merge table again keeps the propagation
+    norm.schema.update_table(table_1)
+    assert norm.schema._normalizers_config["json"]["config"]["propagation"]["tables"] == {
+        table_1["name"]: {"_dlt_id": "_dlt_root_id"}
+    }
 
     # add subtable
     table_2 = new_table("table_2", parent_table_name="table_1")
@@ -872,6 +890,16 @@ def set_max_nesting(norm: RelationalNormalizer, max_nesting: int) -> None:
     norm._reset()
 
 
+def index_rows(
+    rows: Sequence[Tuple[Tuple[str, str], StrAny]]
+) -> Dict[str, List[Tuple[Tuple[str, str], StrAny]]]:
+    """Groups normalized `rows` by table name in a single pass, keeping the order in which rows were yielded"""
+    by_table: Dict[str, List[Tuple[Tuple[str, str], StrAny]]] = defaultdict(list)
+    for row in rows:
+        by_table[row[0][0]].append(row)
+    return by_table
+
+
 def add_dlt_root_id_propagation(norm: RelationalNormalizer) -> None:
     RelationalNormalizer.update_normalizer_config(
         norm.schema,
@@ -33,6 +33,17 @@ def test_get_preferred_type(schema: Schema) -> None:
     assert schema.get_preferred_type("_timestamp") is None
 
 
+def test_get_preferred_type_cache(schema: Schema) -> None:
+    # resolved without preferred types
+    assert schema.get_preferred_type("timestamp") is None
+    assert schema._preferred_types_cache["timestamp"] is None
+    # compiling settings drops resolved types
+    _add_preferred_types(schema)
+    assert "timestamp" not in schema._preferred_types_cache
+    assert schema.get_preferred_type("timestamp") == "timestamp"
+    assert schema._preferred_types_cache["timestamp"] == "timestamp"
+
+
 def test_map_column_preferred_type(schema: Schema) -> None:
     _add_preferred_types(schema)
     # preferred type match
@@ -108,6 +108,25 @@ def test_complete_package_failed_jobs(load_storage: LoadStorage) -> None:
     assert package_info.jobs["failed_jobs"] == failed_info
 
 
+def test_list_failed_jobs_in_package(load_storage: LoadStorage) -> None:
+    load_id, file_name = start_loading_file(load_storage, [{"content": "a"}, {"content": "b"}])
+    # no failed jobs folder content yet
+    assert load_storage.list_failed_jobs_in_package(load_id) == []
+    load_storage.normalized_packages.fail_job(load_id, file_name, "EXCEPTION")
+    # failed jobs are listed from normalized package
+    failed_info = load_storage.list_failed_jobs_in_package(load_id)
+    assert len(failed_info) == 1
+    assert failed_info[0].failed_message == "EXCEPTION"
+    package_info = load_storage.get_load_package_info(load_id)
+    assert failed_info[0].file_path == package_info.jobs["failed_jobs"][0].file_path
+    # and from loaded package
+    load_storage.complete_load_package(load_id, False)
+    failed_info = load_storage.list_failed_jobs_in_package(load_id)
+    assert failed_info == load_storage.get_load_package_info(load_id).jobs["failed_jobs"]
+    with pytest.raises(LoadPackageNotFound):
+        load_storage.list_failed_jobs_in_package("565-not-found")
+
+
 def test_abort_package(load_storage: LoadStorage) -> None:
     # loads with failed jobs are always persisted
     load_storage.config.delete_completed_jobs = True
@@ -7,7 +7,7 @@ from dlt.common import logger, pendulum
 from dlt.common.storages import LoadStorage
 from dlt.common.storages.load_package import ParsedLoadJobFileName
 
-from dlt.destinations.path_utils import create_path, get_table_prefix_layout
+from dlt.destinations.path_utils import compile_layout, create_path, get_table_prefix_layout
 
 from dlt.destinations.exceptions import InvalidFilesystemLayout, CantExtractTablePrefix
 from tests.common.storages.utils import start_loading_file, load_storage
@@ -359,6 +359,26 @@ def test_create_path(test_load: TestLoad) -> None:
     assert path == f"schema_name/mock_table/{load_id}.{job_info.file_format}"
 
 
+def test_compile_layout(test_load: TestLoad) -> None:
+    load_id, job_info = test_load
+    layout = "{schema_name}/{table_name}/{YYYY}-{MM}/{load_id}.{file_id}.{ext}"
+    path_builder = compile_layout(layout)
+    for _ in range(2):
+        path = path_builder(job_info.file_name(), "schema_name", load_id, frozen_datetime, None)
+        assert path == create_path(
+            layout,
+            schema_name="schema_name",
+            load_id=load_id,
+            file_name=job_info.file_name(),
+            load_package_timestamp=frozen_datetime,
+        )
+        assert path == f"schema_name/mock_table/2024-04/{load_id}.{job_info.file_id}.jsonl"
+
+    # layout is validated when compiled
+    with pytest.raises(InvalidFilesystemLayout):
+        compile_layout("{schema_name}/{table_name}/{unknown}.{ext}")
+
+
 def test_get_table_prefix_layout() -> None:
     prefix_layout = get_table_prefix_layout("{schema_name}/{table_name}/{load_id}.{file_id}.{ext}")
     assert prefix_layout == "{schema_name}/{table_name}/"
@@ -2,9 +2,12 @@ import posixpath
 import os
 from unittest import mock
 from pathlib import Path
+from typing import Any, Optional, Type
 
 import pytest
+from fsspec import AbstractFileSystem
 
+from dlt.common import pendulum
 from dlt.common.time import ensure_pendulum_datetime
 from dlt.common.utils import digest128, uniq_id
 from dlt.common.storages import FileStorage, ParsedLoadJobFileName
@@ -12,10 +15,12 @@ from dlt.common.storages import FileStorage, ParsedLoadJobFileName
 from dlt.destinations.impl.filesystem.filesystem import (
     FilesystemDestinationClientConfiguration,
     INIT_FILE_NAME,
+    LoadFilesystemJob,
+    _put_file_supports_max_concurrency,
 )
 
 
-from dlt.destinations.path_utils import create_path, prepare_datetime_params
+from dlt.destinations.path_utils import compile_layout, create_path, prepare_datetime_params
 from tests.load.filesystem.utils import perform_load
 from tests.utils import clean_test_storage, init_test_logging
 from tests.load.utils import TEST_FILE_LAYOUTS
@@ -47,6 +52,62 @@ def test_filesystem_destination_configuration() -> None:
     ).fingerprint() == digest128("s3://cool")
 
 
+class ConcurrentPutFileSystem(AbstractFileSystem):
+    async def _put_file(
+        self, lpath: str, rpath: str, max_concurrency: int = None, **kwargs: Any
+    ) -> None:
+        pass
+
+
+class SequentialPutFileSystem(AbstractFileSystem):
+    async def _put_file(self, lpath: str, rpath: str, **kwargs: Any) -> None:
+        pass
+
+
+def test_put_file_supports_max_concurrency() -> None:
+    assert _put_file_supports_max_concurrency(ConcurrentPutFileSystem) is True
+    assert _put_file_supports_max_concurrency(SequentialPutFileSystem) is False
+    # sync filesystems do not implement _put_file at all
+    assert _put_file_supports_max_concurrency(AbstractFileSystem) is False
+
+
+@pytest.mark.parametrize(
+    "fs_class,upload_concurrency,max_concurrency",
+    (
+        (ConcurrentPutFileSystem, 3, True),
+        (ConcurrentPutFileSystem, None, False),
+        (SequentialPutFileSystem, 3, False),
+    ),
+)
+def test_load_job_upload_concurrency(
+    fs_class: Type[AbstractFileSystem], upload_concurrency: Optional[int], max_concurrency: bool
+) -> None:
+    config = FilesystemDestinationClientConfiguration(
+        bucket_url="s3://cool", upload_concurrency=upload_concurrency
+    )
+    fs = fs_class()
+    local_path = os.path.join("_storage", NORMALIZED_FILES[0])
+    with mock.patch.object(fs, "put_file") as put_file, mock.patch(
+        "dlt.destinations.impl.filesystem.filesystem.fsspec_from_config",
+        return_value=(fs, "cool"),
+    ):
+        job = LoadFilesystemJob(
+            local_path,
+            "cool/dataset",
+            config=config,
+            path_builder=compile_layout(config.layout),
+            schema_name="event",
+            load_id="1234",
+            load_package_timestamp=pendulum.now(),
+        )
+    if max_concurrency:
+        put_file.assert_called_once_with(
+            local_path, job.make_remote_path(), max_concurrency=upload_concurrency
+        )
+    else:
+        put_file.assert_called_once_with(local_path, job.make_remote_path())
+
+
 @pytest.mark.parametrize("write_disposition", ("replace", "append", "merge"))
 @pytest.mark.parametrize("layout", TEST_FILE_LAYOUTS)
 def test_successful_load(write_disposition: str, layout: str, with_gdrive_buckets_env: str) -> None:
@@ -229,3 +290,30 @@ def test_append_write_disposition(layout: str, default_buckets_env: str) -> None
                         continue
                     paths.append(Path(posixpath.join(basedir, f)))
             assert list(sorted(paths)) == expected_files
+
+
+def test_truncate_tables_rm_single_path() -> None:
+    """Truncate through a filesystem that accepts a single path in `rm` (ie. gdrive)"""
+    os.environ["DESTINATION__FILESYSTEM__BUCKET_URL"] = "_storage"
+    dataset_name = "test_" + uniq_id()
+    with perform_load(dataset_name, NORMALIZED_FILES, write_disposition="append") as load_info:
+        client, _, _, _ = load_info
+        table_names = [ParsedLoadJobFileName.parse(f).table_name for f in NORMALIZED_FILES]
+        table_dirs = set(client.get_table_dirs(table_names))
+        table_prefixes = [client.get_table_prefix(t) for t in table_names]
+        assert any(client.list_files_with_prefixes(d, table_prefixes) for d in table_dirs)
+
+        fs_rm = client.fs_client.rm
+
+        def rm(path: str, recursive: bool = False, maxdepth: int = None) -> None:
+            assert isinstance(path, str)
+            fs_rm(path, recursive=recursive, maxdepth=maxdepth)
+
+        with mock.patch.object(
+            client.fs_client, "rm_file", side_effect=NotImplementedError
+        ), mock.patch.object(client.fs_client, "rm", side_effect=rm) as rm_mock:
+            client.truncate_tables(table_names)
+
+        assert rm_mock.call_count == 2
+        for table_dir in table_dirs:
+            assert client.list_files_with_prefixes(table_dir, table_prefixes) == []
@@ -12,9 +12,14 @@ from dlt.common import logger
 from dlt.common import json, pendulum
 from dlt.common.configuration import resolve
 from dlt.common.configuration.inject import with_config
-from dlt.common.configuration.specs import AnyAzureCredentials
+from dlt.common.configuration.specs import AnyAzureCredentials, AwsCredentials
 from dlt.common.storages import fsspec_from_config, FilesystemConfiguration
-from dlt.common.storages.fsspec_filesystem import MTIME_DISPATCH, glob_files
+from dlt.common.storages.fsspec_filesystem import (
+    MTIME_DISPATCH,
+    S3_MAX_POOL_CONNECTIONS,
+    glob_files,
+    prepare_fsspec_args,
+)
 from dlt.common.utils import custom_environ, uniq_id
 from dlt.destinations import filesystem
 from dlt.destinations.impl.filesystem.configuration import (
@@ -155,6 +160,25 @@ def test_filesystem_configuration_with_additional_arguments() -> None:
     }
 
 
+def test_s3_connection_pool_size() -> None:
+    config = FilesystemConfiguration(bucket_url="s3://bucket", credentials=AwsCredentials())
+    fs_kwargs = prepare_fsspec_args(config)
+    assert fs_kwargs["config_kwargs"] == {"max_pool_connections": S3_MAX_POOL_CONNECTIONS}
+
+    # explicit config kwargs take precedence
+    config = FilesystemConfiguration(
+        bucket_url="s3://bucket",
+        credentials=AwsCredentials(),
+        kwargs={"config_kwargs": {"max_pool_connections": 5, "tcp_keepalive": True}},
+    )
+    fs_kwargs = prepare_fsspec_args(config)
+    assert fs_kwargs["config_kwargs"] == {"max_pool_connections": 5, "tcp_keepalive": True}
+
+    # other filesystems are not affected
+    config = FilesystemConfiguration(bucket_url="file:///tmp")
+    assert "config_kwargs" not in prepare_fsspec_args(config)
+
+
 @pytest.mark.skipif("s3" not in ALL_FILESYSTEM_DRIVERS, reason="s3 destination not configured")
 def test_kwargs_propagate_to_s3_instance(default_buckets_env: str) -> None:
     os.environ["DESTINATION__FILESYSTEM__KWARGS"] = '{"use_ssl": false}'
@@ -1,12 +1,14 @@
 import pytest
 import contextlib
 import codecs
+import io
 import os
 from typing import Any, Iterator, List, Sequence, IO, Tuple, Optional, Dict, Union, Generator
 import shutil
 from pathlib import Path
 from urllib.parse import urlparse
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 
 import dlt
 from dlt.common import json, sleep
@@ -24,6 +26,7 @@ from dlt.common.destination.reference import (
 from dlt.common.destination import TLoaderFileFormat, Destination
 from dlt.common.destination.reference import DEFAULT_FILE_LAYOUT
 from dlt.common.data_writers import DataWriter
+from dlt.common.data_writers.writers import ALL_WRITERS
 from dlt.common.schema import TTableSchemaColumns, Schema
 from dlt.common.storages import SchemaStorage, FileStorage, SchemaStorageConfiguration
 from dlt.common.schema.utils import new_table
@@ -31,6 +34,7 @@ from dlt.common.storages import ParsedLoadJobFileName, LoadStorage, PackageStora
 from dlt.common.typing import StrAny
 from dlt.common.utils import uniq_id
 
+from dlt.destinations import filesystem
 from dlt.destinations.sql_client import SqlClientBase
 from dlt.destinations.job_client_impl import SqlJobClientBase
 
@@ -56,27 +60,29 @@ FILE_BUCKET = dlt.config.get("tests.bucket_url_file", str)
 R2_BUCKET = dlt.config.get("tests.bucket_url_r2", str)
 MEMORY_BUCKET = dlt.config.get("tests.memory", str)
 
-ALL_FILESYSTEM_DRIVERS = dlt.config.get("ALL_FILESYSTEM_DRIVERS", list) or [
-    "s3",
-    "gs",
-    "az",
-    "gdrive",
-    "file",
-    "memory",
-    "r2",
-]
+ALL_FILESYSTEM_DRIVERS = frozenset(
+    dlt.config.get("ALL_FILESYSTEM_DRIVERS", list)
+    or [
+        "s3",
+        "gs",
+        "az",
+        "gdrive",
+        "file",
+        "memory",
+        "r2",
+    ]
+)
 
 # Filter out buckets not in all filesystem drivers
-WITH_GDRIVE_BUCKETS = [GCS_BUCKET, AWS_BUCKET, FILE_BUCKET, MEMORY_BUCKET, AZ_BUCKET, GDRIVE_BUCKET]
-WITH_GDRIVE_BUCKETS = [
+WITH_GDRIVE_BUCKETS = tuple(
     bucket
-    for bucket in WITH_GDRIVE_BUCKETS
+    for bucket in (GCS_BUCKET, AWS_BUCKET, FILE_BUCKET, MEMORY_BUCKET, AZ_BUCKET, GDRIVE_BUCKET)
     if (urlparse(bucket).scheme or "file") in ALL_FILESYSTEM_DRIVERS
-]
+)
 
 # temporary solution to include gdrive bucket in tests,
 # while gdrive is not working as a destination
-DEFAULT_BUCKETS = [bucket for bucket in WITH_GDRIVE_BUCKETS if bucket != GDRIVE_BUCKET]
+DEFAULT_BUCKETS = tuple(bucket for bucket in WITH_GDRIVE_BUCKETS if bucket != GDRIVE_BUCKET)
 
 # Add r2 in extra buckets so it's not run for all tests
 R2_BUCKET_CONFIG = dict(
@@ -95,19 +101,19 @@ FILE_LAYOUT_MANY_TABLES_ONE_FOLDER = "{table_name}88{load_id}-u-{file_id}.{ext}"
 FILE_LAYOUT_TABLE_IN_MANY_FOLDERS = "{table_name}/{load_id}/{file_id}.{ext}"
 FILE_LAYOUT_TABLE_NOT_FIRST = "{schema_name}/{table_name}/{load_id}/{file_id}.{ext}"
 
-TEST_FILE_LAYOUTS = [
+TEST_FILE_LAYOUTS = (
     DEFAULT_FILE_LAYOUT,
     FILE_LAYOUT_CLASSIC,
     FILE_LAYOUT_MANY_TABLES_ONE_FOLDER,
     FILE_LAYOUT_TABLE_IN_MANY_FOLDERS,
     FILE_LAYOUT_TABLE_NOT_FIRST,
-]
+)
 
 EXTRA_BUCKETS: List[Dict[str, Any]] = []
 if "r2" in ALL_FILESYSTEM_DRIVERS:
     EXTRA_BUCKETS.append(R2_BUCKET_CONFIG)
 
-ALL_BUCKETS = DEFAULT_BUCKETS + EXTRA_BUCKETS
+ALL_BUCKETS = DEFAULT_BUCKETS + tuple(EXTRA_BUCKETS)
 
 
 @dataclass
@@ -127,7 +133,7 @@ class DestinationTestConfiguration:
     supports_dbt: bool = True
     disable_compression: bool = False
 
-    @property
+    @cached_property
     def name(self) -> str:
         name: str = self.destination
         if self.file_format:
@@ -142,11 +148,15 @@ class DestinationTestConfiguration:
 
     def setup(self) -> None:
         """Sets up environment variables for this destination configuration"""
-        os.environ["DESTINATION__FILESYSTEM__BUCKET_URL"] = self.bucket_url or ""
-        os.environ["DESTINATION__STAGE_NAME"] = self.stage_name or ""
-        os.environ["DESTINATION__STAGING_IAM_ROLE"] = self.staging_iam_role or ""
-        os.environ["DESTINATION__STAGING_USE_MSI"] = str(self.staging_use_msi) or ""
-        os.environ["DESTINATION__FORCE_ICEBERG"] = str(self.force_iceberg) or ""
+        os.environ.update(
+            {
+                "DESTINATION__FILESYSTEM__BUCKET_URL": self.bucket_url or "",
+                "DESTINATION__STAGE_NAME": self.stage_name or "",
+                "DESTINATION__STAGING_IAM_ROLE": self.staging_iam_role or "",
+                "DESTINATION__STAGING_USE_MSI": str(self.staging_use_msi),
+                "DESTINATION__FORCE_ICEBERG": str(self.force_iceberg),
+            }
+        )
 
         """For the filesystem destinations we disable compression to make analyzing the result easier"""
         if self.destination == "filesystem" or self.disable_compression:
@@ -181,278 +191,334 @@ def destinations_configs(
     supports_merge: Optional[bool] = None,
     supports_dbt: Optional[bool] = None,
     force_iceberg: Optional[bool] = None,
+) -> List[DestinationTestConfiguration]:
+    """Returns destination configurations selected by flags and filtered by the remaining arguments.
+    Configurations are built once per distinct set of arguments, a new list is returned on each call
+    """
+    if file_format and isinstance(file_format, str):
+        file_format = [file_format]
+    return list(
+        _destinations_configs(
+            default_sql_configs,
+            default_vector_configs,
+            default_staging_configs,
+            all_staging_configs,
+            local_filesystem_configs,
+            all_buckets_filesystem_configs,
+            tuple(subset),
+            tuple(exclude),
+            tuple(file_format) if file_format else None,
+            supports_merge,
+            supports_dbt,
+            force_iceberg,
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _default_sql_configs() -> Tuple[DestinationTestConfiguration, ...]:
+    """Default non staging sql based configs, one per destination"""
+    destination_configs: List[DestinationTestConfiguration] = []
+    destination_configs += [
+        DestinationTestConfiguration(destination=destination)
+        for destination in SQL_DESTINATIONS
+        if destination not in ("athena", "mssql", "synapse", "databricks", "dremio", "clickhouse")
+    ]
+    destination_configs += [
+        DestinationTestConfiguration(destination="duckdb", file_format="parquet")
+    ]
+    # Athena needs filesystem staging, which will be automatically set; we have to supply a bucket url though.
+    destination_configs += [
+        DestinationTestConfiguration(
+            destination="athena",
+            file_format="parquet",
+            supports_merge=False,
+            bucket_url=AWS_BUCKET,
+        )
+    ]
+    destination_configs += [
+        DestinationTestConfiguration(
+            destination="athena",
+            file_format="parquet",
+            bucket_url=AWS_BUCKET,
+            force_iceberg=True,
+            supports_merge=True,
+            supports_dbt=False,
+            extra_info="iceberg",
+        )
+    ]
+    destination_configs += [
+        DestinationTestConfiguration(
+            destination="clickhouse", file_format="jsonl", supports_dbt=False
+        )
+    ]
+    destination_configs += [
+        DestinationTestConfiguration(
+            destination="databricks",
+            file_format="parquet",
+            bucket_url=AZ_BUCKET,
+            extra_info="az-authorization",
+        )
+    ]
+
+    destination_configs += [
+        DestinationTestConfiguration(
+            destination="dremio",
+            staging=filesystem(destination_name="minio"),
+            file_format="parquet",
+            bucket_url=AWS_BUCKET,
+            supports_dbt=False,
+        )
+    ]
+    destination_configs += [
+        DestinationTestConfiguration(destination="mssql", supports_dbt=False),
+        DestinationTestConfiguration(destination="synapse", supports_dbt=False),
+    ]
+
+    # sanity check that when selecting default destinations, one of each sql destination is actually
+    # provided
+    assert set(SQL_DESTINATIONS) == {d.destination for d in destination_configs}
+    return tuple(destination_configs)
+
+
+@lru_cache(maxsize=None)
+def _default_staging_configs() -> Tuple[DestinationTestConfiguration, ...]:
+    """Default staging configs"""
+    return (
+        DestinationTestConfiguration(
+            destination="redshift",
+            staging="filesystem",
+            file_format="parquet",
+            bucket_url=AWS_BUCKET,
+            staging_iam_role="arn:aws:iam::267388281016:role/redshift_s3_read",
+            extra_info="s3-role",
+        ),
+        DestinationTestConfiguration(
+            destination="bigquery",
+            staging="filesystem",
+            file_format="parquet",
+            bucket_url=GCS_BUCKET,
+            extra_info="gcs-authorization",
+        ),
+        DestinationTestConfiguration(
+            destination="snowflake",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=GCS_BUCKET,
+            stage_name="PUBLIC.dlt_gcs_stage",
+            extra_info="gcs-integration",
+        ),
+        DestinationTestConfiguration(
+            destination="snowflake",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=AWS_BUCKET,
+            extra_info="s3-integration",
+        ),
+        DestinationTestConfiguration(
+            destination="snowflake",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=AWS_BUCKET,
+            stage_name="PUBLIC.dlt_s3_stage",
+            extra_info="s3-integration",
+        ),
+        DestinationTestConfiguration(
+            destination="snowflake",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=AZ_BUCKET,
+            stage_name="PUBLIC.dlt_az_stage",
+            extra_info="az-integration",
+        ),
+        DestinationTestConfiguration(
+            destination="snowflake",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=AZ_BUCKET,
+            extra_info="az-authorization",
+        ),
+        DestinationTestConfiguration(
+            destination="databricks",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=AWS_BUCKET,
+            extra_info="s3-authorization",
+            disable_compression=True,
+        ),
+        DestinationTestConfiguration(
+            destination="databricks",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=AZ_BUCKET,
+            extra_info="az-authorization",
+            disable_compression=True,
+        ),
+        DestinationTestConfiguration(
+            destination="databricks",
+            staging="filesystem",
+            file_format="parquet",
+            bucket_url=AWS_BUCKET,
+            extra_info="s3-authorization",
+        ),
+        DestinationTestConfiguration(
+            destination="synapse",
+            staging="filesystem",
+            file_format="parquet",
+            bucket_url=AZ_BUCKET,
+            extra_info="az-authorization",
+            disable_compression=True,
+        ),
+        DestinationTestConfiguration(
+            destination="clickhouse",
+            staging="filesystem",
+            file_format="parquet",
+            bucket_url=GCS_BUCKET,
+            extra_info="gcs-authorization",
+        ),
+        DestinationTestConfiguration(
+            destination="clickhouse",
+            staging="filesystem",
+            file_format="parquet",
+            bucket_url=AWS_BUCKET,
+            extra_info="s3-authorization",
+        ),
+        DestinationTestConfiguration(
+            destination="clickhouse",
+            staging="filesystem",
+            file_format="parquet",
+            bucket_url=AZ_BUCKET,
+            extra_info="az-authorization",
+        ),
+        DestinationTestConfiguration(
+            destination="clickhouse",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=AZ_BUCKET,
+            extra_info="az-authorization",
+        ),
+        DestinationTestConfiguration(
+            destination="clickhouse",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=GCS_BUCKET,
+            extra_info="gcs-authorization",
+        ),
+        DestinationTestConfiguration(
+            destination="clickhouse",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=AWS_BUCKET,
+            extra_info="s3-authorization",
+        ),
+        DestinationTestConfiguration(
+            destination="dremio",
+            staging=filesystem(destination_name="minio"),
+            file_format="parquet",
+            bucket_url=AWS_BUCKET,
+            supports_dbt=False,
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def _all_staging_configs() -> Tuple[DestinationTestConfiguration, ...]:
+    """Staging configs added on top of the default ones when all staging configs are requested"""
+    return (
+        DestinationTestConfiguration(
+            destination="redshift",
+            staging="filesystem",
+            file_format="parquet",
+            bucket_url=AWS_BUCKET,
+            extra_info="credential-forwarding",
+        ),
+        DestinationTestConfiguration(
+            destination="snowflake",
+            staging="filesystem",
+            file_format="parquet",
+            bucket_url=AWS_BUCKET,
+            extra_info="credential-forwarding",
+        ),
+        DestinationTestConfiguration(
+            destination="redshift",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=AWS_BUCKET,
+            extra_info="credential-forwarding",
+        ),
+        DestinationTestConfiguration(
+            destination="bigquery",
+            staging="filesystem",
+            file_format="jsonl",
+            bucket_url=GCS_BUCKET,
+            extra_info="gcs-authorization",
+        ),
+        DestinationTestConfiguration(
+            destination="synapse",
+            staging="filesystem",
+            file_format="parquet",
+            bucket_url=AZ_BUCKET,
+            staging_use_msi=True,
+            extra_info="az-managed-identity",
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def _local_filesystem_configs() -> Tuple[DestinationTestConfiguration, ...]:
+    """Local filesystem destination configs, one per file format"""
+    return (
+        DestinationTestConfiguration(
+            destination="filesystem", bucket_url=FILE_BUCKET, file_format="insert_values"
+        ),
+        DestinationTestConfiguration(
+            destination="filesystem", bucket_url=FILE_BUCKET, file_format="parquet"
+        ),
+        DestinationTestConfiguration(
+            destination="filesystem", bucket_url=FILE_BUCKET, file_format="jsonl"
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def _destinations_configs(
+    default_sql_configs: bool,
+    default_vector_configs: bool,
+    default_staging_configs: bool,
+    all_staging_configs: bool,
+    local_filesystem_configs: bool,
+    all_buckets_filesystem_configs: bool,
+    subset: Tuple[str, ...],
+    exclude: Tuple[str, ...],
+    file_format: Optional[Tuple[TLoaderFileFormat, ...]],
+    supports_merge: Optional[bool],
+    supports_dbt: Optional[bool],
+    force_iceberg: Optional[bool],
 ) -> List[DestinationTestConfiguration]:
     # sanity check
     for item in subset:
         assert item in IMPLEMENTED_DESTINATIONS, f"Destination {item} is not implemented"
 
-    # import filesystem destination to use named version for minio
-    from dlt.destinations import filesystem
-
     # build destination configs
     destination_configs: List[DestinationTestConfiguration] = []
 
     # default non staging sql based configs, one per destination
     if default_sql_configs:
-        destination_configs += [
-            DestinationTestConfiguration(destination=destination)
-            for destination in SQL_DESTINATIONS
-            if destination
-            not in ("athena", "mssql", "synapse", "databricks", "dremio", "clickhouse")
-        ]
-        destination_configs += [
-            DestinationTestConfiguration(destination="duckdb", file_format="parquet")
-        ]
-        # Athena needs filesystem staging, which will be automatically set; we have to supply a bucket url though.
-        destination_configs += [
-            DestinationTestConfiguration(
-                destination="athena",
-                file_format="parquet",
-                supports_merge=False,
-                bucket_url=AWS_BUCKET,
-            )
-        ]
-        destination_configs += [
-            DestinationTestConfiguration(
-                destination="athena",
-                file_format="parquet",
-                bucket_url=AWS_BUCKET,
-                force_iceberg=True,
-                supports_merge=True,
-                supports_dbt=False,
-                extra_info="iceberg",
-            )
-        ]
-        destination_configs += [
-            DestinationTestConfiguration(
-                destination="clickhouse", file_format="jsonl", supports_dbt=False
-            )
-        ]
-        destination_configs += [
-            DestinationTestConfiguration(
-                destination="databricks",
-                file_format="parquet",
-                bucket_url=AZ_BUCKET,
-                extra_info="az-authorization",
-            )
-        ]
-
-        destination_configs += [
-            DestinationTestConfiguration(
-                destination="dremio",
-                staging=filesystem(destination_name="minio"),
-                file_format="parquet",
-                bucket_url=AWS_BUCKET,
-                supports_dbt=False,
-            )
-        ]
-        destination_configs += [
-            DestinationTestConfiguration(destination="mssql", supports_dbt=False),
-            DestinationTestConfiguration(destination="synapse", supports_dbt=False),
-        ]
-
-        # sanity check that when selecting default destinations, one of each sql destination is actually
-        # provided
-        assert set(SQL_DESTINATIONS) == {d.destination for d in destination_configs}
+        destination_configs += _default_sql_configs()
 
     if default_vector_configs:
         # for now only weaviate
         destination_configs += [DestinationTestConfiguration(destination="weaviate")]
 
     if default_staging_configs or all_staging_configs:
-        destination_configs += [
-            DestinationTestConfiguration(
-                destination="redshift",
-                staging="filesystem",
-                file_format="parquet",
-                bucket_url=AWS_BUCKET,
-                staging_iam_role="arn:aws:iam::267388281016:role/redshift_s3_read",
-                extra_info="s3-role",
-            ),
-            DestinationTestConfiguration(
-                destination="bigquery",
-                staging="filesystem",
-                file_format="parquet",
-                bucket_url=GCS_BUCKET,
-                extra_info="gcs-authorization",
-            ),
-            DestinationTestConfiguration(
-                destination="snowflake",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=GCS_BUCKET,
-                stage_name="PUBLIC.dlt_gcs_stage",
-                extra_info="gcs-integration",
-            ),
-            DestinationTestConfiguration(
-                destination="snowflake",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=AWS_BUCKET,
-                extra_info="s3-integration",
-            ),
-            DestinationTestConfiguration(
-                destination="snowflake",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=AWS_BUCKET,
-                stage_name="PUBLIC.dlt_s3_stage",
-                extra_info="s3-integration",
-            ),
-            DestinationTestConfiguration(
-                destination="snowflake",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=AZ_BUCKET,
-                stage_name="PUBLIC.dlt_az_stage",
-                extra_info="az-integration",
-            ),
-            DestinationTestConfiguration(
-                destination="snowflake",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=AZ_BUCKET,
-                extra_info="az-authorization",
-            ),
-            DestinationTestConfiguration(
-                destination="databricks",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=AWS_BUCKET,
-                extra_info="s3-authorization",
-                disable_compression=True,
-            ),
-            DestinationTestConfiguration(
-                destination="databricks",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=AZ_BUCKET,
-                extra_info="az-authorization",
-                disable_compression=True,
-            ),
-            DestinationTestConfiguration(
-                destination="databricks",
-                staging="filesystem",
-                file_format="parquet",
-                bucket_url=AWS_BUCKET,
-                extra_info="s3-authorization",
-            ),
-            DestinationTestConfiguration(
-                destination="synapse",
-                staging="filesystem",
-                file_format="parquet",
-                bucket_url=AZ_BUCKET,
-                extra_info="az-authorization",
-                disable_compression=True,
-            ),
-            DestinationTestConfiguration(
-                destination="clickhouse",
-                staging="filesystem",
-                file_format="parquet",
-                bucket_url=GCS_BUCKET,
-                extra_info="gcs-authorization",
-            ),
-            DestinationTestConfiguration(
-                destination="clickhouse",
-                staging="filesystem",
-                file_format="parquet",
-                bucket_url=AWS_BUCKET,
-                extra_info="s3-authorization",
-            ),
-            DestinationTestConfiguration(
-                destination="clickhouse",
-                staging="filesystem",
-                file_format="parquet",
-                bucket_url=AZ_BUCKET,
-                extra_info="az-authorization",
-            ),
-            DestinationTestConfiguration(
-                destination="clickhouse",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=AZ_BUCKET,
-                extra_info="az-authorization",
-            ),
-            DestinationTestConfiguration(
-                destination="clickhouse",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=GCS_BUCKET,
-                extra_info="gcs-authorization",
-            ),
-            DestinationTestConfiguration(
-                destination="clickhouse",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=AWS_BUCKET,
-                extra_info="s3-authorization",
-            ),
-            DestinationTestConfiguration(
-                destination="dremio",
-                staging=filesystem(destination_name="minio"),
-                file_format="parquet",
-                bucket_url=AWS_BUCKET,
-                supports_dbt=False,
-            ),
-        ]
+        destination_configs += _default_staging_configs()
 
     if all_staging_configs:
-        destination_configs += [
-            DestinationTestConfiguration(
-                destination="redshift",
-                staging="filesystem",
-                file_format="parquet",
-                bucket_url=AWS_BUCKET,
-                extra_info="credential-forwarding",
-            ),
-            DestinationTestConfiguration(
-                destination="snowflake",
-                staging="filesystem",
-                file_format="parquet",
-                bucket_url=AWS_BUCKET,
-                extra_info="credential-forwarding",
-            ),
-            DestinationTestConfiguration(
-                destination="redshift",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=AWS_BUCKET,
-                extra_info="credential-forwarding",
-            ),
-            DestinationTestConfiguration(
-                destination="bigquery",
-                staging="filesystem",
-                file_format="jsonl",
-                bucket_url=GCS_BUCKET,
-                extra_info="gcs-authorization",
-            ),
-            DestinationTestConfiguration(
-                destination="synapse",
-                staging="filesystem",
-                file_format="parquet",
-                bucket_url=AZ_BUCKET,
-                staging_use_msi=True,
-                extra_info="az-managed-identity",
-            ),
-        ]
+        destination_configs += _all_staging_configs()
 
     # add local filesystem destinations if requested
     if local_filesystem_configs:
-        destination_configs += [
-            DestinationTestConfiguration(
-                destination="filesystem", bucket_url=FILE_BUCKET, file_format="insert_values"
-            )
-        ]
-        destination_configs += [
-            DestinationTestConfiguration(
-                destination="filesystem", bucket_url=FILE_BUCKET, file_format="parquet"
-            )
-        ]
-        destination_configs += [
-            DestinationTestConfiguration(
-                destination="filesystem", bucket_url=FILE_BUCKET, file_format="jsonl"
-            )
-        ]
+        destination_configs += _local_filesystem_configs()
 
     if all_buckets_filesystem_configs:
         for bucket in DEFAULT_BUCKETS:
@@ -462,47 +528,24 @@ def destinations_configs(
                 )
             ]
 
-    # filter out non active destinations
-    destination_configs = [
-        conf for conf in destination_configs if conf.destination in ACTIVE_DESTINATIONS
-    ]
-
-    # filter out destinations not in subset
-    if subset:
-        destination_configs = [conf for conf in destination_configs if conf.destination in subset]
-    if exclude:
-        destination_configs = [
-            conf for conf in destination_configs if conf.destination not in exclude
-        ]
-    if file_format:
-        if not isinstance(file_format, Sequence):
-            file_format = [file_format]
-        destination_configs = [
-            conf
-            for conf in destination_configs
-            if conf.file_format and conf.file_format in file_format
-        ]
-    if supports_merge is not None:
-        destination_configs = [
-            conf for conf in destination_configs if conf.supports_merge == supports_merge
-        ]
-    if supports_dbt is not None:
-        destination_configs = [
-            conf for conf in destination_configs if conf.supports_dbt == supports_dbt
-        ]
-
-    # filter out excluded configs
-    destination_configs = [
-        conf for conf in destination_configs if conf.name not in EXCLUDED_DESTINATION_CONFIGURATIONS
+    # filter out non active destinations, destinations not in subset or excluded, excluded configs
+    # and configs not matching the requested capabilities in a single pass
+    subset_set = set(subset)
+    exclude_set = set(exclude)
+    file_format_set = set(file_format or ())
+    return [
+        conf
+        for conf in destination_configs
+        if conf.destination in ACTIVE_DESTINATIONS
+        and (not subset_set or conf.destination in subset_set)
+        and conf.destination not in exclude_set
+        and (not file_format_set or conf.file_format in file_format_set)
+        and (supports_merge is None or conf.supports_merge == supports_merge)
+        and (supports_dbt is None or conf.supports_dbt == supports_dbt)
+        and conf.name not in EXCLUDED_DESTINATION_CONFIGURATIONS
+        and (force_iceberg is None or conf.force_iceberg is force_iceberg)
     ]
 
-    if force_iceberg is not None:
-        destination_configs = [
-            conf for conf in destination_configs if conf.force_iceberg is force_iceberg
-        ]
-
-    return destination_configs
-
 
 @pytest.fixture
 def empty_schema() -> Schema:
@@ -522,9 +565,16 @@ def get_normalized_dataset_name(client: JobClientBase) -> str:
         )
 
 
+@lru_cache(maxsize=None)
+def _read_case_file(path: str) -> bytes:
+    """Reads content of a test case file once, cases are not modified by the tests"""
+    with open(path, "rb") as f:
+        return f.read()
+
+
 def load_table(name: str) -> Dict[str, TTableSchemaColumns]:
-    with open(f"./tests/load/cases/{name}.json", "rb") as f:
-        return json.load(f)
+    # parse on each call so callers get tables they can modify
+    return json.loadb(_read_case_file(f"./tests/load/cases/{name}.json"))
 
 
 def expect_load_file(
@@ -543,8 +593,11 @@ def expect_load_file(
     file_storage.save(file_name, query.encode("utf-8"))
     table = client.prepare_load_table(table_name)
     job = client.start_file_load(table, file_storage.make_full_path(file_name), uniq_id())
+    # poll with exponential backoff so fast local jobs are not waited on for the full interval
+    delay = 0.01
     while job.state() == "running":
-        sleep(0.5)
+        sleep(delay)
+        delay = min(delay * 1.5, 0.5)
     assert job.file_name() == file_name
     assert job.state() == status
     return job
@@ -669,38 +722,41 @@ def write_dataset(
     rows: Union[List[Dict[str, Any]], List[StrAny]],
     columns_schema: TTableSchemaColumns,
 ) -> None:
-    spec = DataWriter.writer_spec_from_file_format(
-        client.capabilities.preferred_loader_file_format, "object"
+    # look up the writer class once and take the spec from it
+    writer_cls = DataWriter.class_factory(
+        client.capabilities.preferred_loader_file_format, "object", ALL_WRITERS
     )
     # adapt bytes stream to text file format
-    if not spec.is_binary_format and isinstance(f.read(0), bytes):
+    if not writer_cls.writer_spec().is_binary_format and not isinstance(f, io.TextIOBase):
         f = codecs.getwriter("utf-8")(f)  # type: ignore[assignment]
-    writer = DataWriter.from_file_format(
-        client.capabilities.preferred_loader_file_format, "object", f, client.capabilities
-    )
-    # remove None values
-    for idx, row in enumerate(rows):
-        rows[idx] = {k: v for k, v in row.items() if v is not None}
+    writer = writer_cls(f, client.capabilities)
+    # remove None values without modifying the caller's rows, copy only if any row has them
+    if any(v is None for row in rows for v in row.values()):
+        rows = [{k: v for k, v in row.items() if v is not None} for row in rows]
     writer.write_all(columns_schema, rows)
     writer.close()
 
 
+LOADING_SCHEMA_PATH = "./tests/load/cases/loading/schema.json"
+LOADING_SCHEMA_UPDATES_PATH = "./tests/load/cases/loading/schema_updates.json"
+
+
 def prepare_load_package(
     load_storage: LoadStorage, cases: Sequence[str], write_disposition: str = "append"
 ) -> Tuple[str, Schema]:
     load_id = uniq_id()
     load_storage.new_packages.create_package(load_id)
+    new_jobs_path = load_storage.new_packages.storage.make_full_path(
+        load_storage.new_packages.get_job_folder_path(load_id, "new_jobs")
+    )
     for case in cases:
-        path = f"./tests/load/cases/loading/{case}"
-        shutil.copy(
-            path,
-            load_storage.new_packages.storage.make_full_path(
-                load_storage.new_packages.get_job_folder_path(load_id, "new_jobs")
-            ),
+        # job files are only read and moved by the loader so hard link the cases where possible
+        FileStorage.link_hard_with_fallback(
+            f"./tests/load/cases/loading/{case}", os.path.join(new_jobs_path, case)
         )
-    schema_path = Path("./tests/load/cases/loading/schema.json")
+    schema_path = Path(LOADING_SCHEMA_PATH)
     # load without migration
-    data = json.loads(schema_path.read_text(encoding="utf8"))
+    data = json.loadb(_read_case_file(LOADING_SCHEMA_PATH))
     for name, table in data["tables"].items():
         if name.startswith("_dlt"):
             continue
@@ -708,10 +764,9 @@ def prepare_load_package(
     full_package_path = load_storage.new_packages.storage.make_full_path(
         load_storage.new_packages.get_package_path(load_id)
     )
-    Path(full_package_path).joinpath(schema_path.name).write_text(json.dumps(data), encoding="utf8")
+    Path(full_package_path).joinpath(schema_path.name).write_bytes(json.dumpb(data))
 
-    schema_update_path = "./tests/load/cases/loading/schema_updates.json"
-    shutil.copy(schema_update_path, full_package_path)
+    shutil.copy(LOADING_SCHEMA_UPDATES_PATH, full_package_path)
 
     load_storage.commit_new_load_package(load_id)
     schema = load_storage.normalized_packages.load_schema(load_id)
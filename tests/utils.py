@@ -148,8 +148,7 @@ def duckdb_pipeline_location() -> Iterator[None]:
 
 @pytest.fixture(autouse=True)
 def patch_home_dir() -> Iterator[None]:
-    with patch("dlt.common.configuration.paths._get_user_home_dir") as _get_home_dir:
-        _get_home_dir.return_value = os.path.abspath(TEST_STORAGE_ROOT)
+    with patch("dlt.common.configuration.paths._USER_HOME", os.path.abspath(TEST_STORAGE_ROOT)):
         yield
 
 
@@ -157,8 +156,7 @@ def patch_home_dir() -> Iterator[None]:
 def patch_random_home_dir() -> Iterator[None]:
     global_dir = os.path.join(TEST_STORAGE_ROOT, "global_" + uniq_id())
     os.makedirs(global_dir, exist_ok=True)
-    with patch("dlt.common.configuration.paths._get_user_home_dir") as _get_home_dir:
-        _get_home_dir.return_value = os.path.abspath(global_dir)
+    with patch("dlt.common.configuration.paths._USER_HOME", os.path.abspath(global_dir)):
         yield
 
 